@@ -3,15 +3,44 @@
 import json
 import logging
 import os
-from typing import Any, Dict
+import time
+from typing import Any, Dict, Optional, Tuple
 
-from config import get_config_loader
+from config import DEFAULT_SECRETS_CACHE_TTL, SyncConfig, get_config_loader
 from sync import sync_issues
 
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(os.getenv('LOG_LEVEL', 'INFO').upper())
 
+# The configuration is reused across warm invocations and reloaded once it is
+# older than SECRETS_CACHE_TTL, so a rotated secret reaches warm containers.
+_CACHED_CONFIG: Optional[Tuple[float, SyncConfig]] = None
+
+# Create the Secrets Manager client during Lambda's init phase, which runs with
+# boosted CPU, rather than inside the first invocation. This only happens when
+# running in Lambda or with ENVIRONMENT explicitly set to 'aws', so importing
+# this module elsewhere (tests, local tooling) doesn't load boto3.
+if os.getenv('AWS_LAMBDA_FUNCTION_NAME') or os.getenv('ENVIRONMENT', '').lower() == 'aws':
+    try:
+        get_config_loader('aws').prepare()
+    except Exception as e:
+        logger.warning(f"Could not pre-initialize AWS clients: {str(e)}")
+
+
+def _get_config() -> SyncConfig:
+    """Load the configuration and return the cached copy until it expires.
+
+    The config source is selected by the ENVIRONMENT variable (default: 'aws')
+    through the loader table in ``get_config_loader``. The cached copy expires
+    after ``SECRETS_CACHE_TTL`` seconds, like the secrets it holds.
+    """
+    global _CACHED_CONFIG
+    ttl = float(os.getenv('SECRETS_CACHE_TTL', str(DEFAULT_SECRETS_CACHE_TTL)))
+    if _CACHED_CONFIG is None or time.monotonic() - _CACHED_CONFIG[0] >= ttl:
+        _CACHED_CONFIG = (time.monotonic(), get_config_loader(os.getenv('ENVIRONMENT', 'aws')).load())
+    return _CACHED_CONFIG[1]
+
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """AWS Lambda handler function.
     
@@ -23,12 +52,8 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         Response dictionary
     """
     try:
-        # Load configuration using AWS config loader
-        config_loader = get_config_loader('aws')
-        config = config_loader.load()
-        
-        # Run sync
-        sync_issues(config)
+        # Run sync using the (cached) configuration
+        sync_issues(_get_config())
         
         return {
             'statusCode': 200,
@@ -42,9 +67,5 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         }
 
 def main():
-    # Load configuration using AWS config loader
-    config_loader = get_config_loader('aws')
-    config = config_loader.load()
-    
-    # Run sync
-    sync_issues(config)
+    # Run sync using the (cached) configuration
+    sync_issues(_get_config())
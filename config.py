@@ -5,21 +5,67 @@ This module provides a flexible configuration system that supports multiple envi
 """
 
 import abc
-import json
 import logging
 import os
-from dataclasses import dataclass
-from typing import Any, Dict, Optional
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, fields
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, ClassVar, Dict, FrozenSet, Mapping, Optional, Tuple, Type
 
-import boto3
-from botocore.exceptions import ClientError
-from dotenv import load_dotenv
+from dotenv import find_dotenv, load_dotenv
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    from json import loads as _json_loads
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Default lifetime (seconds) of cached secrets, matching the AWS Parameters and
+# Secrets Lambda Extension default. Override with SECRETS_CACHE_TTL.
+DEFAULT_SECRETS_CACHE_TTL = 300
+
+# Module-level state survives across warm Lambda invocations, so secrets and the
+# Secrets Manager client are only resolved once per container (or per TTL).
+_SECRET_CACHE: Dict[str, Tuple[float, str]] = {}
+_SECRETS_CLIENTS: Dict[Optional[str], Any] = {}
+
+# Local endpoint of the AWS Parameters and Secrets Lambda Extension. The loader
+# uses it when PARAMETERS_SECRETS_EXTENSION_HTTP_PORT is set in the environment.
+SECRETS_EXTENSION_URL = "http://localhost:{port}/secretsmanager/get?secretId={secret_id}"
+SECRETS_EXTENSION_TIMEOUT = 2
+
+# botocore client settings for Secrets Manager: fail fast on transient network
+# problems instead of hanging the invocation, and keep connections alive.
+SECRETS_CLIENT_CONFIG = {
+    'connect_timeout': 2,
+    'read_timeout': 5,
+    'retries': {'max_attempts': 3, 'mode': 'adaptive'},
+    'tcp_keepalive': True,
+    'max_pool_connections': 10,
+}
+
+@lru_cache(maxsize=None)
+def _parse_field_map(raw_value: str) -> Dict[str, Any]:
+    """Parse a JIRA_TO_AIRTABLE_FIELD_MAP value.
+
+    Environment variables are fixed for the life of a process (or Lambda
+    container), so each distinct value is only parsed once.
+    """
+    return _json_loads(raw_value)
+
+
+@dataclass(frozen=True)
 class SyncConfig:
-    """Data class representing the sync configuration."""
+    """Data class representing the sync configuration.
+
+    Instances are immutable; use ``dataclasses.replace`` to derive a modified copy.
+    """
     jira_server: str
     jira_username: str
     jira_api_token: str
@@ -30,19 +76,21 @@ class SyncConfig:
     field_mappings: Dict[str, Any]
     batch_size: int = 50
 
+    # Fields that must be present and non-empty for the sync to run
+    _REQUIRED: ClassVar[FrozenSet[str]] = frozenset({
+        'jira_server',
+        'jira_username',
+        'jira_api_token',
+        'jira_project_key',
+        'airtable_api_key',
+        'airtable_base_id',
+        'airtable_table_name',
+        'field_mappings',
+    })
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert config to dictionary format."""
-        return {
-            'jira_server': self.jira_server,
-            'jira_username': self.jira_username,
-            'jira_api_token': self.jira_api_token,
-            'jira_project_key': self.jira_project_key,
-            'airtable_api_key': self.airtable_api_key,
-            'airtable_base_id': self.airtable_base_id,
-            'airtable_table_name': self.airtable_table_name,
-            'field_mappings': self.field_mappings,
-            'batch_size': self.batch_size,
-        }
+        return asdict(self)
 
     @classmethod
     def from_dict(cls, config_dict: Dict[str, Any]) -> 'SyncConfig':
@@ -51,23 +99,20 @@ class SyncConfig:
 
     def validate(self) -> None:
         """Validate the configuration."""
-        # Check required fields are not empty
-        for field, value in self.to_dict().items():
-            if field == 'batch_size':
+        # Check required fields are not empty (in declaration order)
+        for field in fields(self):
+            if field.name not in self._REQUIRED:
                 continue
-                
+
+            value = getattr(self, field.name)
             if isinstance(value, str):
                 # For string fields, check they're not empty after stripping whitespace
-                if not value.strip():
-                    logger.error(f"Configuration validation failed: {field} is empty or whitespace")
-                    raise ValueError(f"Empty value for required configuration: {field}")
-                logger.debug(f"Validated {field} (length: {len(value)})")
-            elif value is None:
-                logger.error(f"Configuration validation failed: {field} is None")
-                raise ValueError(f"Empty value for required configuration: {field}")
-            elif not value and not isinstance(value, bool):  # Allow False as a valid value
-                logger.error(f"Configuration validation failed: {field} is empty")
-                raise ValueError(f"Empty value for required configuration: {field}")
+                empty = not value.strip()
+            else:
+                empty = value is None or (not value and not isinstance(value, bool))  # Allow False as a valid value
+            if empty:
+                logger.error(f"Configuration validation failed: {field.name} is empty")
+                raise ValueError(f"Empty value for required configuration: {field.name}")
 
         # Validate field mappings format
         if not isinstance(self.field_mappings, dict):
@@ -110,7 +155,10 @@ class LocalConfigLoader(ConfigLoader):
         if self.env_file:
             load_dotenv(self.env_file, override=True)
         else:
-            load_dotenv(override=True)
+            # Same upward search load_dotenv() does, skipping the load when no .env exists
+            dotenv_path = find_dotenv()
+            if dotenv_path:
+                load_dotenv(dotenv_path, override=True)
 
         config = SyncConfig(
             jira_server=os.getenv('JIRA_SERVER', ''),
@@ -120,7 +168,7 @@ class LocalConfigLoader(ConfigLoader):
             airtable_api_key=os.getenv('AIRTABLE_API_KEY', ''),
             airtable_base_id=os.getenv('AIRTABLE_BASE_ID', ''),
             airtable_table_name=os.getenv('AIRTABLE_TABLE_NAME', ''),
-            field_mappings=json.loads(os.getenv('JIRA_TO_AIRTABLE_FIELD_MAP', '{}')),
+            field_mappings=_parse_field_map(os.getenv('JIRA_TO_AIRTABLE_FIELD_MAP', '{}')),
             batch_size=int(os.getenv('BATCH_SIZE', '50')),
         )
         
@@ -138,27 +186,82 @@ class AWSConfigLoader(ConfigLoader):
             region: Optional AWS region. If not provided, will be extracted from secret ARNs.
         """
         self.region = region
-        self._secrets_client = None
+        self.cache_ttl = float(os.getenv('SECRETS_CACHE_TTL', str(DEFAULT_SECRETS_CACHE_TTL)))
 
     @property
     def secrets_client(self):
-        """Lazy initialization of AWS Secrets Manager client."""
-        if self._secrets_client is None:
+        """Lazy initialization of AWS Secrets Manager client.
+
+        Clients are shared at module scope per region so that credential
+        resolution and connection setup are amortized across warm invocations.
+        """
+        client = _SECRETS_CLIENTS.get(self.region)
+        if client is None:
+            # boto3 is imported lazily so local and Docker runs never pay for it
+            import boto3
+            from botocore.config import Config
+
             session = boto3.session.Session()
-            self._secrets_client = session.client(
+            client = session.client(
                 service_name='secretsmanager',
-                region_name=self.region
+                region_name=self.region,
+                config=Config(**SECRETS_CLIENT_CONFIG)
             )
-        return self._secrets_client
+            _SECRETS_CLIENTS[self.region] = client
+        return client
+
+    def prepare(self) -> None:
+        """Resolve the region and create the Secrets Manager client ahead of use.
+
+        The client is skipped when the Parameters and Secrets Lambda Extension is
+        configured, since secrets are then read without boto3.
+        """
+        if not self.region:
+            secret_arn = os.getenv('JIRA_API_TOKEN_SECRET_ARN')
+            if secret_arn:
+                self.region = secret_arn.split(':')[3]  # Extract region from ARN
+        if not os.getenv('PARAMETERS_SECRETS_EXTENSION_HTTP_PORT'):
+            self.secrets_client
+
+    def _get_secret_from_extension(self, secret_arn: str) -> Optional[Dict[str, Any]]:
+        """Fetch a secret through the Parameters and Secrets Lambda Extension.
+
+        Returns:
+            The GetSecretValue response, or None if the extension is not configured
+            or could not be reached (callers then fall back to boto3).
+        """
+        port = os.getenv('PARAMETERS_SECRETS_EXTENSION_HTTP_PORT')
+        session_token = os.getenv('AWS_SESSION_TOKEN')
+        if not port or not session_token:
+            return None
+
+        url = SECRETS_EXTENSION_URL.format(port=port, secret_id=urllib.parse.quote(secret_arn, safe=''))
+        request = urllib.request.Request(url, headers={'X-Aws-Parameters-Secrets-Token': session_token})
+        try:
+            with urllib.request.urlopen(request, timeout=SECRETS_EXTENSION_TIMEOUT) as response:
+                return _json_loads(response.read())
+        except (urllib.error.URLError, OSError, ValueError) as e:
+            logger.warning(f"Secrets extension unavailable, falling back to Secrets Manager API: {str(e)}")
+            return None
 
     def get_secret(self, secret_arn: str) -> str:
-        """Get secret value from AWS Secrets Manager."""
+        """Get secret value from AWS Secrets Manager.
+
+        Values are served from an in-memory cache while younger than ``cache_ttl``.
+        """
+        sanitized_arn = f"{secret_arn[:8]}...{secret_arn[-8:]}"
+        cached = _SECRET_CACHE.get(secret_arn)
+        if cached is not None and time.monotonic() - cached[0] < self.cache_ttl:
+            logger.debug("Using cached secret for ARN: %s", sanitized_arn)
+            return cached[1]
+
         try:
             if not self.region:
                 self.region = secret_arn.split(':')[3]  # Extract region from ARN
-            sanitized_arn = f"{secret_arn[:8]}...{secret_arn[-8:]}"
-            logger.info(f"Fetching secret from ARN: {sanitized_arn}")
-            response = self.secrets_client.get_secret_value(SecretId=secret_arn)
+            logger.info("Fetching secret from ARN: %s", sanitized_arn)
+            response = self._get_secret_from_extension(secret_arn)
+            if response is None:
+                response = self.secrets_client.get_secret_value(SecretId=secret_arn)
             
             if 'SecretString' in response:
                 secret_value = response['SecretString']
@@ -166,21 +269,25 @@ class AWSConfigLoader(ConfigLoader):
                     logger.error("A secret exists but contains an empty string")
                     raise ValueError("A secret contains an empty string")
                 
-                # Ensure proper string encoding and remove any whitespace
-                secret_value = secret_value.encode('utf-8').decode('utf-8').strip()
+                # Remove any surrounding whitespace
+                secret_value = secret_value.strip()
                 logger.info("Successfully retrieved secret")
-                               
+
+                _SECRET_CACHE[secret_arn] = (time.monotonic(), secret_value)
                 return secret_value
             
             logger.error(f"Secret {sanitized_arn} does not contain a SecretString")
             raise ValueError(f"Secret {sanitized_arn} does not contain a string value")
-        except ClientError as e:
-            error_code = e.response['Error']['Code']
-            error_message = e.response['Error']['Message']
-            logger.error(f"AWS Error fetching secret {sanitized_arn}: {error_code} - {error_message}")
-            raise
         except Exception as e:
-            logger.error(f"Unexpected error fetching secret {sanitized_arn}: {str(e)}")
+            # botocore's ClientError carries the service error in ``response``;
+            # checking for it avoids importing botocore just for the except clause.
+            error = getattr(e, 'response', None)
+            if isinstance(error, dict) and 'Error' in error:
+                error_code = error['Error'].get('Code')
+                error_message = error['Error'].get('Message')
+                logger.error(f"AWS Error fetching secret {sanitized_arn}: {error_code} - {error_message}")
+            else:
+                logger.error(f"Unexpected error fetching secret {sanitized_arn}: {str(e)}")
             raise
 
     def load(self) -> SyncConfig:
@@ -192,11 +299,17 @@ class AWSConfigLoader(ConfigLoader):
         if not jira_token_arn or not airtable_key_arn:
             raise ValueError("Missing required secret ARNs")
 
-        # Fetch secrets first
+        # Resolve the region and client up front so both worker threads share
+        # a single client (and its connection pool) instead of racing to create one.
+        self.prepare()
+
+        # Fetch both secrets concurrently
         logger.info("Fetching secrets from AWS Secrets Manager...")
         try:
-            jira_token = self.get_secret(jira_token_arn)
-            airtable_key = self.get_secret(airtable_key_arn)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                jira_future = executor.submit(self.get_secret, jira_token_arn)
+                airtable_future = executor.submit(self.get_secret, airtable_key_arn)
+                jira_token, airtable_key = jira_future.result(), airtable_future.result()
             logger.info("Successfully retrieved secrets")
         except Exception:
             logger.error("Failed to retrieve secrets", exc_info=True)
@@ -211,7 +324,7 @@ class AWSConfigLoader(ConfigLoader):
             airtable_api_key=airtable_key,
             airtable_base_id=os.getenv('AIRTABLE_BASE_ID', ''),
             airtable_table_name=os.getenv('AIRTABLE_TABLE_NAME', ''),
-            field_mappings=json.loads(os.getenv('JIRA_TO_AIRTABLE_FIELD_MAP', '{}')),
+            field_mappings=_parse_field_map(os.getenv('JIRA_TO_AIRTABLE_FIELD_MAP', '{}')),
             batch_size=int(os.getenv('BATCH_SIZE', '50')),
         )
         
@@ -232,6 +345,14 @@ class DockerConfigLoader(LocalConfigLoader):
     pass
 
 
+# Supported environments and their loader classes (read-only)
+_LOADERS: Mapping[str, Type[ConfigLoader]] = MappingProxyType({
+    'local': LocalConfigLoader,
+    'aws': AWSConfigLoader,
+    'docker': DockerConfigLoader,
+})
+
+
 def get_config_loader(environment: str = 'local', **kwargs) -> ConfigLoader:
     """Factory function to get the appropriate config loader.
     
@@ -245,16 +366,10 @@ def get_config_loader(environment: str = 'local', **kwargs) -> ConfigLoader:
     Raises:
         ValueError: If environment is not supported
     """
-    logger.info(f"Getting config loader for environment: {environment}")
-    loaders = {
-        'local': LocalConfigLoader,
-        'aws': AWSConfigLoader,
-        'docker': DockerConfigLoader,
-    }
-    
-    loader_class = loaders.get(environment.lower())
-    if not loader_class:
+    logger.info("Getting config loader for environment: %s", environment)
+    loader_class = _LOADERS.get(environment.lower())
+    if loader_class is None:
         raise ValueError(f"Unsupported environment: {environment}")
     
-    logger.info(f"Using config loader class: {loader_class.__name__}")
+    logger.info("Using config loader class: %s", loader_class.__name__)
     return loader_class(**kwargs)
@@ -2,7 +2,7 @@
 
 from .collector import MetricsCollector
 from .formatter import process_metrics, format_table
-from .utils import format_duration, format_memory, format_bytes, calculate_percentile
+from .utils import format_duration, format_memory, format_bytes, calculate_percentile, calculate_percentiles
 
 __all__ = [
     'MetricsCollector',
@@ -11,5 +11,6 @@ __all__ = [
     'format_duration',
     'format_memory',
     'format_bytes',
-    'calculate_percentile'
+    'calculate_percentile',
+    'calculate_percentiles'
 ]
@@ -2,10 +2,33 @@
 
 import json
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 
-import boto3
+NAMESPACE = 'AWS/Lambda'
+PERIOD = 60  # 1-minute periods
+
+# Metrics and statistics to collect
+METRIC_NAMES = (
+    'Invocations',
+    'Errors',
+    'Duration',
+    'Throttles',
+    'ConcurrentExecutions',
+)
+STATISTICS = ('Average', 'Maximum', 'Minimum', 'Sum')
+
+# botocore client settings: bounded timeouts, adaptive retries, pooled keep-alive
+# connections sized for the parallel GetMetricStatistics fallback.
+CLIENT_CONFIG = {
+    'connect_timeout': 2,
+    'read_timeout': 10,
+    'retries': {'max_attempts': 3, 'mode': 'adaptive'},
+    'tcp_keepalive': True,
+    'max_pool_connections': 10,
+}
 
 
 class DateTimeEncoder(json.JSONEncoder):
@@ -16,6 +39,10 @@ class DateTimeEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+# Shared compact encoder, built once instead of per get_metrics_json call
+_ENCODER = DateTimeEncoder(separators=(',', ':'))
+
+
 class MetricsCollector:
     """Collects metrics from CloudWatch for Lambda functions."""
 
@@ -28,11 +55,20 @@ class MetricsCollector:
         """
         self.function_name = function_name
         self.region = region or os.getenv('AWS_REGION', 'us-west-2')
-        self.cloudwatch = boto3.client('cloudwatch', region_name=self.region)
+
+        # Imported here so importing the metrics package stays cheap
+        import boto3
+        from botocore.config import Config
+
+        self.cloudwatch = boto3.client('cloudwatch', region_name=self.region, config=Config(**CLIENT_CONFIG))
 
     def get_metrics(self, start_time: datetime, end_time: datetime) -> Dict[str, List[Dict]]:
         """Get metrics for the Lambda function.
-        
+
+        Uses a single batched ``GetMetricData`` request and falls back to parallel
+        ``GetMetricStatistics`` calls if that API is unavailable (e.g. not permitted
+        by the caller's IAM policy).
+
         Args:
             start_time: Start time for metrics query
             end_time: End time for metrics query
@@ -40,36 +76,89 @@ class MetricsCollector:
         Returns:
             Dictionary containing metrics data for different metric types
         """
-        metrics = {}
-        period = 60  # 1-minute periods
-
-        # Define metrics to collect
-        metric_names = [
-            'Invocations',
-            'Errors',
-            'Duration',
-            'Throttles',
-            'ConcurrentExecutions'
-        ]
-
-        # Collect each metric
-        for metric_name in metric_names:
+        from botocore.exceptions import ClientError
+
+        try:
+            return self._get_metric_data(start_time, end_time)
+        except ClientError as e:
+            print(f"GetMetricData failed, falling back to GetMetricStatistics: {e}", file=sys.stderr)
+            return self._get_metric_statistics(start_time, end_time)
+
+    def _get_metric_data(self, start_time: datetime, end_time: datetime) -> Dict[str, Dict]:
+        """Fetch all metrics with one (paginated) ``GetMetricData`` request.
+
+        Results are reshaped into the per-metric ``get_metric_statistics`` response format.
+        """
+        # One query per (metric, statistic) pair, since GetMetricData returns a single stat per query
+        queries = []
+        query_keys = {}
+        for i, metric_name in enumerate(METRIC_NAMES):
+            for j, statistic in enumerate(STATISTICS):
+                query_id = f"m{i}s{j}"
+                query_keys[query_id] = (metric_name, statistic)
+                queries.append({
+                    'Id': query_id,
+                    'MetricStat': {
+                        'Metric': {
+                            'Namespace': NAMESPACE,
+                            'MetricName': metric_name,
+                            'Dimensions': [{'Name': 'FunctionName', 'Value': self.function_name}],
+                        },
+                        'Period': PERIOD,
+                        'Stat': statistic,
+                    },
+                })
+
+        # metric name -> timestamp -> datapoint
+        datapoints: Dict[str, Dict[datetime, Dict[str, Any]]] = {name: {} for name in METRIC_NAMES}
+        request = {
+            'MetricDataQueries': queries,
+            'StartTime': start_time,
+            'EndTime': end_time,
+        }
+        while True:
+            response = self.cloudwatch.get_metric_data(**request)
+            for result in response['MetricDataResults']:
+                metric_name, statistic = query_keys[result['Id']]
+                points = datapoints[metric_name]
+                for timestamp, value in zip(result['Timestamps'], result['Values']):
+                    points.setdefault(timestamp, {'Timestamp': timestamp})[statistic] = value
+
+            next_token = response.get('NextToken')
+            if not next_token:
+                break
+            request['NextToken'] = next_token
+
+        # Add namespace and metric name to each response for processing
+        return {
+            metric_name: {
+                'Datapoints': list(datapoints[metric_name].values()),
+                'Namespace': NAMESPACE,
+                'Label': metric_name,
+            }
+            for metric_name in METRIC_NAMES
+        }
+
+    def _get_metric_statistics(self, start_time: datetime, end_time: datetime) -> Dict[str, Dict]:
+        """Fetch each metric with its own ``GetMetricStatistics`` call, run concurrently."""
+        def fetch(metric_name: str) -> Dict:
             response = self.cloudwatch.get_metric_statistics(
-                Namespace='AWS/Lambda',
+                Namespace=NAMESPACE,
                 MetricName=metric_name,
                 Dimensions=[{'Name': 'FunctionName', 'Value': self.function_name}],
                 StartTime=start_time,
                 EndTime=end_time,
-                Period=period,
-                Statistics=['Average', 'Maximum', 'Minimum', 'Sum']
+                Period=PERIOD,
+                Statistics=list(STATISTICS)
             )
-            
+
             # Add namespace and metric name to response for processing
-            response['Namespace'] = 'AWS/Lambda'
+            response['Namespace'] = NAMESPACE
             response['Label'] = metric_name
-            metrics[metric_name] = response
+            return response
 
-        return metrics
+        with ThreadPoolExecutor(max_workers=len(METRIC_NAMES)) as executor:
+            return dict(zip(METRIC_NAMES, executor.map(fetch, METRIC_NAMES)))
 
     def get_metrics_json(self, start_time: datetime, end_time: datetime) -> str:
         """Get metrics in JSON format.
@@ -79,7 +168,7 @@ class MetricsCollector:
             end_time: End time for metrics query
             
         Returns:
-            JSON string containing metrics data
+            JSON array string with one entry per metric
         """
         metrics = self.get_metrics(start_time, end_time)
-        return '\n\n'.join(json.dumps(metric_data, cls=DateTimeEncoder) for metric_data in metrics.values())
+        return _ENCODER.encode(list(metrics.values()))
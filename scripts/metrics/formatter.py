@@ -1,71 +1,127 @@
 """Format CloudWatch metrics into human-readable tables."""
 
+import io
 import json
-import statistics
 import sys
-from typing import Dict, Any
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, TextIO, Tuple, Union
 
-from tabulate import tabulate
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    from json import loads as _json_loads
 
-from .utils import format_duration, calculate_percentile
+from .utils import format_duration, calculate_percentiles
 
+# Datapoint field accessors, used with map() so columns are extracted in C
+_SUM = itemgetter('Sum')
+_AVERAGE = itemgetter('Average')
+_MAXIMUM = itemgetter('Maximum')
+_MINIMUM = itemgetter('Minimum')
 
-def process_metrics(raw_metrics: str) -> Dict[str, Any]:
-    """Process raw metrics into summary statistics."""
+# Percentiles reported for Duration (median and p90)
+_DURATION_PERCENTILES = (50, 90)
+
+
+def _summarize_count(datapoints: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Summarize a count metric (Invocations, Errors, Throttles)."""
+    return {
+        'total': sum(map(_SUM, datapoints)),
+        'type': 'count'
+    }
+
+
+def _summarize_duration(datapoints: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Summarize the Duration metric."""
+    duration_points = list(map(_AVERAGE, datapoints))
+    median, p90 = calculate_percentiles(duration_points, _DURATION_PERCENTILES)
+    return {
+        'avg': sum(duration_points) / len(duration_points),
+        'max': max(map(_MAXIMUM, datapoints)),
+        'min': min(map(_MINIMUM, datapoints)),
+        'median': median,
+        'p90': p90,
+        'type': 'duration'
+    }
+
+
+def _summarize_concurrency(datapoints: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Summarize the ConcurrentExecutions metric."""
+    return {
+        'max': max(map(_MAXIMUM, datapoints)),
+        'avg': sum(map(_AVERAGE, datapoints)) / len(datapoints),
+        'type': 'count'
+    }
+
+
+# CloudWatch metric name -> (key in processed metrics, summarizer)
+_SUMMARIZERS: Dict[str, Tuple[str, Callable[[List[Dict[str, Any]]], Dict[str, Any]]]] = {
+    'Invocations': ('invocations', _summarize_count),
+    'Errors': ('errors', _summarize_count),
+    'Duration': ('duration', _summarize_duration),
+    'Throttles': ('throttles', _summarize_count),
+    'ConcurrentExecutions': ('concurrency', _summarize_concurrency),
+}
+
+
+def _write_table(out: TextIO, rows: List[List[str]], headers: Tuple[str, str] = ('Metric', 'Value')) -> None:
+    """Write a left/right aligned two-column table to ``out``.
+
+    Produces the same layout as ``tabulate(..., tablefmt='simple',
+    colalign=('left', 'right'))`` without the generic table machinery; cell
+    values are stripped, so pre-padded strings are fine. No trailing newline
+    is written.
+    """
+    cells = [(name.strip(), value.strip()) for name, value in rows]
+    # Like tabulate, keep at least two characters of padding around the headers
+    name_width = max(len(headers[0]) + 2, *(len(name) for name, _ in cells))
+    value_width = max(len(headers[1]) + 2, *(len(value) for _, value in cells))
+    out.write(f"{headers[0]:<{name_width}}  {headers[1]:>{value_width}}\n")
+    out.write(f"{'-' * name_width}  {'-' * value_width}")
+    for name, value in cells:
+        out.write(f"\n{name:<{name_width}}  {value:>{value_width}}")
+
+
+def process_metrics(raw_metrics: Union[str, bytes]) -> Dict[str, Any]:
+    """Process raw metrics into summary statistics.
+
+    ``raw_metrics`` may be ``bytes`` (e.g. captured CLI output), which is parsed
+    directly without decoding it to ``str`` first.
+    """
     metrics = {}
     
-    # Split the input into separate JSON objects
-    json_objects = raw_metrics.strip().split('\n\n')
+    # The input is a JSON array with one CloudWatch response per metric
+    try:
+        metric_responses = _json_loads(raw_metrics)
+    except json.JSONDecodeError as e:  # orjson's decode error subclasses this too
+        print(f"Error decoding JSON: {e}", file=sys.stderr)
+        return metrics
     
-    for json_str in json_objects:
+    # A single response object is accepted as a one-element array
+    if isinstance(metric_responses, dict):
+        metric_responses = [metric_responses]
+    elif not isinstance(metric_responses, list):
+        print(f"Error decoding JSON: expected an array of metric responses, got {type(metric_responses).__name__}",
+              file=sys.stderr)
+        return metrics
+    
+    for data in metric_responses:
+        if not isinstance(data, dict):
+            print(f"Skipping malformed metric response: {data!r}", file=sys.stderr)
+            continue
         try:
-            data = json.loads(json_str)
-            
             # Skip empty responses
-            if not data.get('Datapoints'):
+            datapoints = data.get('Datapoints')
+            if not datapoints:
                 continue
                 
             metric_name = data['Label']
             namespace = data.get('Namespace', 'AWS/Lambda')  # Default to AWS/Lambda namespace
             
-            if namespace == 'AWS/Lambda':
-                if metric_name == 'Invocations':
-                    metrics['invocations'] = {
-                        'total': sum(point['Sum'] for point in data['Datapoints']),
-                        'type': 'count'
-                    }
-                elif metric_name == 'Errors':
-                    metrics['errors'] = {
-                        'total': sum(point['Sum'] for point in data['Datapoints']),
-                        'type': 'count'
-                    }
-                elif metric_name == 'Duration':
-                    duration_points = [point['Average'] for point in data['Datapoints']]
-                    if duration_points:
-                        metrics['duration'] = {
-                            'avg': statistics.mean(duration_points),
-                            'max': max(point['Maximum'] for point in data['Datapoints']),
-                            'min': min(point['Minimum'] for point in data['Datapoints']),
-                            'median': statistics.median(duration_points),
-                            'p90': calculate_percentile(duration_points, 90),
-                            'type': 'duration'
-                        }
-                elif metric_name == 'Throttles':
-                    metrics['throttles'] = {
-                        'total': sum(point['Sum'] for point in data['Datapoints']),
-                        'type': 'count'
-                    }
-                elif metric_name == 'ConcurrentExecutions':
-                    concurrent_points = [point['Maximum'] for point in data['Datapoints']]
-                    if concurrent_points:
-                        metrics['concurrency'] = {
-                            'max': max(concurrent_points),
-                            'avg': statistics.mean([point['Average'] for point in data['Datapoints']]),
-                            'type': 'count'
-                        }
-        except json.JSONDecodeError as e:
-            print(f"Error decoding JSON: {e}", file=sys.stderr)
-            continue
+            summary = _SUMMARIZERS.get(metric_name) if namespace == 'AWS/Lambda' else None
+            if summary:
+                key, summarize = summary
+                metrics[key] = summarize(datapoints)
         except KeyError as e:
             print(f"Missing key in data: {e}", file=sys.stderr)
             continue
@@ -115,28 +171,19 @@ def format_table(metrics: Dict[str, Dict[str, Any]], time_range: str) -> str:
             ['Average', f"{metrics['concurrency']['avg']:>8.1f}"]
         ])
     
-    # Build the output with section headers
-    output = []
-    
-    if invocation_rows:
-        output.extend([
-            f"\nInvocations ({time_range}):",
-            tabulate(invocation_rows, headers=['Metric', 'Value'], 
-                    tablefmt='simple', colalign=('left', 'right'))
-        ])
-    
-    if duration_rows:
-        output.extend([
-            f"\nDuration ({time_range}):",
-            tabulate(duration_rows, headers=['Metric', 'Value'],
-                    tablefmt='simple', colalign=('left', 'right'))
-        ])
-    
-    if concurrency_rows:
-        output.extend([
-            f"\nConcurrency ({time_range}):",
-            tabulate(concurrency_rows, headers=['Metric', 'Value'],
-                    tablefmt='simple', colalign=('left', 'right'))
-        ])
+    # Write each non-empty section, with its header, into a single buffer
+    sections = [
+        ('Invocations', invocation_rows),
+        ('Duration', duration_rows),
+        ('Concurrency', concurrency_rows),
+    ]
+    output = io.StringIO()
+    separator = ''
+    for title, rows in sections:
+        if not rows:
+            continue
+        output.write(f"{separator}\n{title} ({time_range}):\n")
+        _write_table(output, rows)
+        separator = '\n'
     
-    return '\n'.join(output)
+    return output.getvalue()
@@ -1,10 +1,17 @@
 """Utility functions for metrics processing."""
 
-from typing import List, Optional
+import math
+from functools import lru_cache
+from typing import List, Optional, Sequence
 
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
 
+
+@lru_cache(maxsize=2048)
 def format_duration(ms: float, right_align: Optional[int] = None) -> str:
     """Format milliseconds into a readable duration.
+
+    Results are memoized, since the same durations tend to be formatted repeatedly.
     
     Args:
         ms: Duration in milliseconds
@@ -13,14 +20,8 @@ def format_duration(ms: float, right_align: Optional[int] = None) -> str:
     Returns:
         Formatted duration string
     """
-    if ms < 1000:
-        result = f"{ms:.1f}ms"
-    else:
-        result = f"{ms/1000:.1f}s"
-        
-    if right_align is not None:
-        return result.rjust(right_align)
-    return result
+    result = f"{ms:.1f}ms" if ms < 1000 else f"{ms/1000:.1f}s"
+    return result if right_align is None else result.rjust(right_align)
 
 
 def format_memory(mb: float) -> str:
@@ -32,23 +33,45 @@ def format_memory(mb: float) -> str:
 
 def format_bytes(bytes_value: float) -> str:
     """Format bytes into human readable format."""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if bytes_value < 1024.0:
-            return f"{bytes_value:.1f}{unit}"
-        bytes_value /= 1024.0
-    return f"{bytes_value:.1f}TB"
+    if bytes_value < 1024.0:
+        return f"{bytes_value:.1f}B"
+    # Each unit is a factor of 2**10, so the unit index falls out of log2
+    index = min(int(math.log2(bytes_value)) // 10, len(_BYTE_UNITS) - 1)
+    return f"{bytes_value / (1 << (10 * index)):.1f}{_BYTE_UNITS[index]}"
 
 
 def calculate_percentile(values: List[float], percentile: float) -> float:
-    """Calculate percentile from a list of values."""
+    """Calculate percentile from a list of values using linear interpolation."""
     if not values:
         return 0.0
+    # The extremes only need a linear scan, not a sort
+    if percentile <= 0:
+        return min(values)
+    if percentile >= 100:
+        return max(values)
+    return calculate_percentiles(values, [percentile])[0]
+
+
+def calculate_percentiles(values: List[float], percentiles: Sequence[float]) -> List[float]:
+    """Calculate several percentiles from a list of values with a single sort.
+
+    Args:
+        values: Values to calculate percentiles from
+        percentiles: Percentiles to calculate (0-100)
+
+    Returns:
+        Percentile values, in the same order as ``percentiles``
+    """
+    if not values:
+        return [0.0] * len(percentiles)
     sorted_values = sorted(values)
-    k = (len(sorted_values) - 1) * (percentile/100.0)
-    f = int(k)
-    c = int(k) + 1 if k % 1 else int(k)
-    if f >= len(sorted_values):
-        return sorted_values[-1]
-    d0 = sorted_values[f] * (c - k)
-    d1 = sorted_values[c] * (k - f) if c < len(sorted_values) else sorted_values[f] * (k - f)
-    return d0 + d1
+    last = len(sorted_values) - 1
+    results = []
+    for percentile in percentiles:
+        k = last * min(max(percentile, 0), 100) / 100.0
+        f = int(k)
+        if f >= last:
+            results.append(sorted_values[last])
+        else:
+            results.append(sorted_values[f] + (sorted_values[f + 1] - sorted_values[f]) * (k - f))
+    return results
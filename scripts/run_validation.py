@@ -9,6 +9,8 @@ import sys
 import logging
 from scripts.validation import config, docker, aws, schema
 from scripts.tests import jira_connection, airtable_connection, sync
+from scripts.utils.env import env
+from scripts.utils.parallel import run_concurrently
 
 # Configure logging - only show INFO and above from our scripts, WARNING and above from others
 logging.basicConfig(
@@ -19,7 +21,9 @@ logger = logging.getLogger('scripts')
 logger.setLevel(logging.INFO)
 
 def run_all_validations():
-    """Run all validation scripts in sequence."""
+    """Run all validation scripts, overlapping the independent network checks."""
+    # Load .env once; every validation below reads from the same snapshot
+    env()
     all_passed = True
     
     # Environment Configuration
@@ -40,29 +44,25 @@ def run_all_validations():
     # Connectivity and Schema
     print("\n4️⃣  Validating Connectivity and Schema")
     
-    # Jira Connection
-    print("\n   Testing Jira connection...")
-    if not jira_connection.main():
-        print("   ❌ Jira connection failed")
-        all_passed = False
-    else:
-        print("   ✅ Jira connection successful")
+    # The Jira, Airtable and schema checks are independent network calls, so
+    # run them concurrently; each check's output is buffered and printed under
+    # its heading, in a fixed order, once all of them have finished
+    network_checks = [
+        ("Testing Jira connection", jira_connection.main, "Jira connection"),
+        ("Testing Airtable connection", airtable_connection.main, "Airtable connection"),
+        ("Validating Airtable schema", schema.main, "Airtable schema validation"),
+    ]
+    outcomes = run_concurrently([check for _, check, _ in network_checks])
     
-    # Airtable Connection
-    print("\n   Testing Airtable connection...")
-    if not airtable_connection.main():
-        print("   ❌ Airtable connection failed")
-        all_passed = False
-    else:
-        print("   ✅ Airtable connection successful")
-    
-    # Schema Validation
-    print("\n   Validating Airtable schema...")
-    if not schema.main():
-        print("   ❌ Airtable schema validation failed")
-        all_passed = False
-    else:
-        print("   ✅ Airtable schema validation successful")
+    for (description, _, name), (passed, lines) in zip(network_checks, outcomes):
+        print(f"\n   {description}...")
+        for line in lines:
+            print(f"   {line}")
+        if not passed:
+            print(f"   ❌ {name} failed")
+            all_passed = False
+        else:
+            print(f"   ✅ {name} successful")
     
     # Sync Test
     print("\n   Testing sync functionality...")
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import os
+import sys
 from dotenv import load_dotenv
 from pyairtable import Api
 
@@ -30,28 +31,20 @@ def get_table_schema():
         print(f"Name: {schema.name}")
         print(f"ID: {schema.id}")
         
-        # Print field information
-        print("\nFields:")
-        # Adjust column widths for better readability
+        # Print field information, building all rows from one format template
+        # and writing them in a single call (widths adjusted for readability)
         name_width = 35
         type_width = 25
         id_width = 35
+        row_format = f"{{:<{name_width}}} {{:<{type_width}}} {{:<{id_width}}}\n".format
         
-        header = (
-            f"{'Field Name':<{name_width}} "
-            f"{'Field Type':<{type_width}} "
-            f"{'Field ID':<{id_width}}"
-        )
-        print(header)
-        print("-" * (name_width + type_width + id_width + 2))  # +2 for spaces
-        
-        for field in schema.fields:
-            row = (
-                f"{field.name:<{name_width}} "
-                f"{field.type:<{type_width}} "
-                f"{field.id:<{id_width}}"
-            )
-            print(row)
+        output = [
+            "\nFields:\n",
+            row_format('Field Name', 'Field Type', 'Field ID'),
+            "-" * (name_width + type_width + id_width + 2) + "\n",  # +2 for spaces
+        ]
+        output.extend(row_format(field.name, field.type, field.id) for field in schema.fields)
+        sys.stdout.write(''.join(output))
             
     except Exception as e:
         print(f"Error getting schema: {str(e)}")
@@ -1,8 +1,29 @@
 #!/usr/bin/env python3
 import os
+import sys
+from operator import itemgetter
 from dotenv import load_dotenv
 from jira import JIRA
 
+_field_name = itemgetter('name')
+
+# Core fields we commonly use
+CORE_FIELDS = frozenset({
+    'key',
+    'summary',
+    'description',
+    'issuetype',
+    'status',
+    'assignee',
+    'reporter',
+    'parent',
+    'created',
+    'updated',
+    'resolutiondate',
+    'customfield_10016',  # Story Points
+    'comment'
+})
+
 def get_jira_schema():
     """Get and print the schema of Jira fields."""
     load_dotenv()
@@ -24,61 +45,36 @@ def get_jira_schema():
         # Get all fields
         fields = jira.fields()
         
-        # Core fields we commonly use
-        core_fields = {
-            'key',
-            'summary',
-            'description',
-            'issuetype',
-            'status',
-            'assignee',
-            'reporter',
-            'parent',
-            'created',
-            'updated',
-            'resolutiondate',
-            'customfield_10016',  # Story Points
-            'comment'
-        }
+        # Partition fields into core and other in a single pass
+        core_field_objects = []
+        other_fields = []
+        for field in fields:
+            if field['id'] in CORE_FIELDS or field['key'] in CORE_FIELDS:
+                core_field_objects.append(field)
+            else:
+                other_fields.append(field)
+        core_field_objects.sort(key=_field_name)
+        other_fields.sort(key=_field_name)
         
-        # Print field information
-        print("\nJira Field Information:")
+        # Print field information, building all rows from one format template
+        # and writing them in a single call
         name_width = 35
         id_width = 25
         jql_width = 35
+        row_format = f"{{:<{name_width}}} {{:<{id_width}}} {{:<{jql_width}}}\n".format
+        header = row_format('Display Name', 'Field ID', 'JQL Name')
+        separator = "-" * (name_width + id_width + jql_width + 2) + "\n"
         
-        header = (
-            f"{'Display Name':<{name_width}} "
-            f"{'Field ID':<{id_width}} "
-            f"{'JQL Name':<{jql_width}}"
-        )
-        print("\nCore Fields:")
-        print(header)
-        print("-" * (name_width + id_width + jql_width + 2))
+        output = ["\nJira Field Information:\n", "\nCore Fields:\n", header, separator]
         
-        # First print core fields
-        core_field_objects = [f for f in fields if f['id'] in core_fields or f['key'] in core_fields]
-        for field in sorted(core_field_objects, key=lambda x: x['name']):
-            row = (
-                f"{field['name']:<{name_width}} "
-                f"{field['id']:<{id_width}} "
-                f"{field['key']:<{jql_width}}"
-            )
-            print(row)
+        # First core fields
+        output.extend(row_format(field['name'], field['id'], field['key']) for field in core_field_objects)
         
-        # Then print all other fields
-        print("\nAll Other Fields:")
-        print(header)
-        print("-" * (name_width + id_width + jql_width + 2))
+        # Then all other fields
+        output.extend(["\nAll Other Fields:\n", header, separator])
+        output.extend(row_format(field['name'], field['id'], field['key']) for field in other_fields)
         
-        other_fields = [f for f in fields if f['id'] not in core_fields and f['key'] not in core_fields]
-        for field in sorted(other_fields, key=lambda x: x['name']):
-            row = (
-                f"{field['name']:<{name_width}} "
-                f"{field['id']:<{id_width}} "
-                f"{field['key']:<{jql_width}}"
-            )
-            print(row)
+        sys.stdout.write(''.join(output))
             
     except Exception as e:
         print(f"Error getting schema: {str(e)}")
@@ -1,8 +1,7 @@
 #!/usr/bin/env python3
-import os
 import sys
 import logging
-from dotenv import load_dotenv
+from scripts.utils.env import env
 from pyairtable import Table
 
 logger = logging.getLogger(__name__)
@@ -11,12 +10,11 @@ logger = logging.getLogger(__name__)
 def test_airtable_connection():
     """Test connection to Airtable."""
     try:
-        load_dotenv(override=True)
-        
         # Get Airtable configuration
-        base_id = os.getenv('AIRTABLE_BASE_ID')
-        table_name = os.getenv('AIRTABLE_TABLE_NAME')
-        api_key = os.getenv('AIRTABLE_API_KEY')
+        environ = env()
+        base_id = environ.get('AIRTABLE_BASE_ID')
+        table_name = environ.get('AIRTABLE_TABLE_NAME')
+        api_key = environ.get('AIRTABLE_API_KEY')
         
         if not all([base_id, table_name, api_key]):
             logger.error("❌ Missing required Airtable configuration")
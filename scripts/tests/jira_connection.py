@@ -1,9 +1,8 @@
 #!/usr/bin/env python3
-import os
 import sys
 import logging
-from dotenv import load_dotenv
-from jira import JIRA
+from scripts.utils.env import env
+from scripts.utils.jira_client import get_client
 
 logger = logging.getLogger(__name__)
 
@@ -11,19 +10,14 @@ logger = logging.getLogger(__name__)
 def test_jira_connection():
     """Test connection to Jira."""
     try:
-        load_dotenv(override=True)
-
         # Initialize Jira client
-        jira = JIRA(
-            server=os.getenv('JIRA_SERVER'),
-            basic_auth=(os.getenv('JIRA_USERNAME'), os.getenv('JIRA_API_TOKEN'))
-        )
+        jira = get_client()
 
         # Test connection by getting server info and an issue
         jira.server_info()
-        jql = os.getenv('JIRA_JQL_FILTER', '')
+        jql = env().get('JIRA_JQL_FILTER', '')
         # Just check if search works, we don't need the results
-        jira.search_issues(jql, maxResults=1)
+        jira.search_issues(jql, maxResults=1, fields='key')
         
         return True
 
@@ -1,49 +1,89 @@
 #!/usr/bin/env python3
-import os
 import sys
-import json
 import logging
-from dotenv import load_dotenv
-from jira import JIRA
+from operator import itemgetter
+from scripts.utils.env import env, get_field_map
+from scripts.utils.jira_client import get_client
 
 logger = logging.getLogger(__name__)
 
-def test_sync():
-    """Test sync process without writing to Airtable."""
+# Matches the MAX_RESULTS page size the sync itself uses
+DEFAULT_BATCH_SIZE = 100
+
+
+def _display_value(value):
+    """Reduce a raw JSON field value to the text the sync writes to Airtable.
+
+    Mirrors JiraAirtableSync._process_field_value: objects such as statuses,
+    users and options are represented by their value, name or display name.
+    """
+    if isinstance(value, dict):
+        for key in ('value', 'name', 'displayName'):
+            if key in value:
+                return str(value[key])
+        return str(value)
+    if isinstance(value, list):
+        return str([_display_value(item) for item in value])
+    return value if isinstance(value, str) else str(value)
+
+
+def test_sync(batch_size: int = DEFAULT_BATCH_SIZE):
+    """Test sync process without writing to Airtable.
+
+    Args:
+        batch_size: Number of issues to request from Jira in a single page
+    """
     try:
-        load_dotenv(override=True)
+        # Load field mappings
+        field_map = get_field_map()
+        if not field_map:
+            logger.error("❌ No field mappings found in JIRA_TO_AIRTABLE_FIELD_MAP")
+            return False
 
         # Initialize Jira client
-        jira = JIRA(
-            server=os.getenv('JIRA_SERVER'),
-            basic_auth=(os.getenv('JIRA_USERNAME'), os.getenv('JIRA_API_TOKEN'))
-        )
+        jira = get_client()
 
-        # Test Jira query
-        jql = os.getenv('JIRA_JQL_FILTER', '')
-        issues = jira.search_issues(jql, maxResults=5)
+        # Test Jira query, fetching only the mapped fields as raw JSON so the
+        # client doesn't build a Resource object graph for every issue
+        jql = env().get('JIRA_JQL_FILTER', '')
+        fields = ",".join(sorted(field_map))
+        result = jira.search_issues(jql, maxResults=batch_size, fields=fields, json_result=True)
+        issues = result['issues']
 
         if not issues:
             logger.warning("⚠️ No issues found with current JQL filter")
             return True
 
-        # Load field mappings
-        field_map = json.loads(os.getenv('JIRA_TO_AIRTABLE_FIELD_MAP', '{}'))
-        if not field_map:
-            logger.error("❌ No field mappings found in JIRA_TO_AIRTABLE_FIELD_MAP")
-            return False
+        if len(issues) < min(batch_size, result['total']):
+            logger.warning(
+                f"⚠️ Jira returned {len(issues)} issues per page (requested {batch_size}); "
+                "the server caps the page size"
+            )
 
-        # Test data transformation
+        # Test data transformation, reading all mapped fields in one itemgetter call
+        jira_fields = tuple(field_map)
+        airtable_fields = [mapping.get('airtable_field_id') for mapping in field_map.values()]
+        getter = itemgetter(*jira_fields)
+        get_values = getter if len(jira_fields) > 1 else lambda fields: (getter(fields),)
+        populated = set()
         for issue in issues:
-            record = {}
-            for jira_field, mapping in field_map.items():
-                try:
-                    value = getattr(issue.fields, jira_field, None)
-                    airtable_field = mapping.get('airtable_field_id')
-                    record[airtable_field] = str(value) if value else None
-                except AttributeError:
-                    logger.debug(f"Field '{jira_field}' not found in Jira issue {issue.key}")
+            issue_fields = issue['fields']
+            try:
+                values = get_values(issue_fields)
+            except KeyError:
+                # Jira omits unset fields, so fall back to per-field lookups for this issue
+                logger.debug(f"Some mapped fields not found in Jira issue {issue['key']}")
+                values = [issue_fields.get(jira_field) for jira_field in jira_fields]
+            record = {
+                airtable_field: _display_value(value) if value else None
+                for airtable_field, value in zip(airtable_fields, values)
+            }
+            populated.update(airtable_field for airtable_field, value in record.items() if value is not None)
 
+        logger.info(
+            f"✅ Transformed {len(issues)} issues; {len(populated)} of {len(airtable_fields)} "
+            "mapped Airtable fields had values"
+        )
         return True
 
     except Exception as e:
@@ -1,13 +1,10 @@
-import os
-from jira import JIRA
-from dotenv import load_dotenv
-
-load_dotenv()
+from scripts.utils.env import env
+from scripts.utils.jira_client import get_client
 
 # Print environment variables (with API token partially masked)
-jira_server = os.getenv('JIRA_SERVER')
-jira_username = os.getenv('JIRA_USERNAME')
-jira_token = os.getenv('JIRA_API_TOKEN')
+jira_server = env().get('JIRA_SERVER')
+jira_username = env().get('JIRA_USERNAME')
+jira_token = env().get('JIRA_API_TOKEN')
 if jira_token:
     masked_token = jira_token[:4] + '*' * (len(jira_token) - 8) + jira_token[-4:]
 else:
@@ -19,15 +16,13 @@ print(f"JIRA_API_TOKEN: {masked_token}")
 
 # Try to connect to Jira
 try:
-    jira = JIRA(server=jira_server, basic_auth=(jira_username, jira_token))
-    print("\nSuccessfully connected to Jira")
+    jira = get_client()
     
-    # Try to get server info
-    try:
-        server_info = jira.server_info()
-        print(f"Server info: {server_info}")
-    except Exception as e:
-        print(f"Error getting server info: {str(e)}")
+    # The client doesn't contact the server until its first request, so the
+    # connection is only confirmed once server info comes back
+    server_info = jira.server_info()
+    print("\nSuccessfully connected to Jira")
+    print(f"Server info: {server_info}")
     
     # Try to get projects
     try:
@@ -38,7 +33,7 @@ try:
         
     # Try to get issues with the current JQL
     try:
-        jql = os.getenv('JIRA_JQL_FILTER', f'project = {os.getenv("JIRA_PROJECT_KEY")}')
+        jql = env().get('JIRA_JQL_FILTER', f'project = {env().get("JIRA_PROJECT_KEY")}')
         print(f"\nTrying JQL query: {jql}")
         issues = jira.search_issues(jql)
         print(f"Found {len(issues)} issues")
@@ -0,0 +1,110 @@
+"""Shared access to the Airtable metadata API for the utility scripts.
+
+A single ``requests.Session`` is reused for every metadata request, so the
+validation scripts run by ``run_validation.py`` share one pooled TCP/TLS
+connection instead of each opening their own. Responses are also cached in
+memory and on disk for a few minutes, so validators in the same run share one
+parsed copy and back-to-back validation runs fetch the schema once.
+"""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional
+    from json import loads as _json_loads
+
+META_TABLES_URL = "https://api.airtable.com/v0/meta/bases/{base_id}/tables"
+REQUEST_TIMEOUT = 10
+
+CACHE_DIR = Path(".cache")
+CACHE_TTL = 300  # seconds
+
+_session = requests.Session()
+
+# Cached copies are keyed by base ID and a hash of the API key, so switching to
+# a key without access to the base doesn't keep serving metadata fetched with
+# the old one
+
+# In-process copy of each base's tables: cache key -> (fetched at, tables)
+_TABLES_CACHE: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+
+# Name index over each base's cached tables: cache key -> (tables it indexes, name -> table)
+_TABLE_INDEX: Dict[str, Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]] = {}
+
+
+def _cache_key(api_key: str, base_id: str) -> str:
+    """Return the cache key for a base's metadata fetched with the given API key."""
+    key_hash = hashlib.sha1((api_key or '').encode()).hexdigest()[:12]
+    return f"{base_id}_{key_hash}"
+
+
+def get_base_tables(api_key: str, base_id: str) -> List[Dict[str, Any]]:
+    """Fetch the table metadata for an Airtable base.
+
+    Args:
+        api_key: Airtable API key
+        base_id: ID of the Airtable base
+
+    Returns:
+        List of table metadata dicts, as returned by the Airtable meta API
+    """
+    cache_key = _cache_key(api_key, base_id)
+    cached = _TABLES_CACHE.get(cache_key)
+    if cached and time.time() - cached[0] < CACHE_TTL:
+        return cached[1]
+
+    cache_file = CACHE_DIR / f"airtable_{cache_key}.json"
+    try:
+        fetched_at = cache_file.stat().st_mtime
+        if time.time() - fetched_at < CACHE_TTL:
+            tables = _json_loads(cache_file.read_bytes())["tables"]
+            _TABLES_CACHE[cache_key] = (fetched_at, tables)
+            return tables
+    except (OSError, ValueError, KeyError):
+        pass  # Missing, unreadable or corrupt cache; fetch a fresh copy
+
+    response = _session.get(
+        META_TABLES_URL.format(base_id=base_id),
+        headers={"Authorization": f"Bearer {api_key}"},
+        timeout=REQUEST_TIMEOUT,
+    )
+    response.raise_for_status()
+    tables = _json_loads(response.content)["tables"]
+    _TABLES_CACHE[cache_key] = (time.time(), tables)
+
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        cache_file.write_text(json.dumps({"tables": tables}))
+    except OSError:
+        pass  # Caching is best effort
+    return tables
+
+
+def get_table(api_key: str, base_id: str, table_name: str) -> Optional[Dict[str, Any]]:
+    """Look up one table's metadata by name.
+
+    The name index is built once per fetched copy of the base's tables and
+    reused by later lookups.
+
+    Args:
+        api_key: Airtable API key
+        base_id: ID of the Airtable base
+        table_name: Name of the table to find
+
+    Returns:
+        The table's metadata dict, or None if the base has no such table
+    """
+    tables = get_base_tables(api_key, base_id)
+    cache_key = _cache_key(api_key, base_id)
+    indexed = _TABLE_INDEX.get(cache_key)
+    if indexed is None or indexed[0] is not tables:
+        indexed = (tables, {table["name"]: table for table in tables})
+        _TABLE_INDEX[cache_key] = indexed
+    return indexed[1].get(table_name)
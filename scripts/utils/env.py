@@ -0,0 +1,56 @@
+"""Shared environment access for the utility scripts.
+
+The ``.env`` file is loaded once per process and the resulting environment is
+exposed as a read-only snapshot, so scripts run in sequence (for example by
+``run_validation.py``) don't each re-parse it.
+"""
+
+import os
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping
+
+from dotenv import load_dotenv
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional
+    from json import loads as _json_loads
+
+
+@lru_cache(maxsize=1)
+def env() -> Mapping[str, str]:
+    """Load ``.env`` on first use and return a read-only snapshot of the environment.
+
+    Variables already exported in the shell take precedence over ``.env``.
+    """
+    load_dotenv()
+    return MappingProxyType(dict(os.environ))
+
+
+@lru_cache(maxsize=1)
+def get_field_map() -> Mapping[str, Any]:
+    """Parse ``JIRA_TO_AIRTABLE_FIELD_MAP`` once and return the shared result.
+
+    The result is shared between callers, so a JSON object is returned as a
+    read-only mapping. Other JSON values are returned as parsed, for the
+    config validator to reject.
+
+    Raises:
+        json.JSONDecodeError: If the configured value is not valid JSON
+            (orjson's decode error is a subclass)
+    """
+    field_map = _json_loads(env().get('JIRA_TO_AIRTABLE_FIELD_MAP', '{}'))
+    return MappingProxyType(field_map) if isinstance(field_map, dict) else field_map
+
+
+@lru_cache(maxsize=1)
+def get_tracking_fields() -> Mapping[str, Any]:
+    """Parse ``TRACKING_FIELDS`` once and return the shared, read-only result.
+
+    Raises:
+        json.JSONDecodeError: If the configured value is not valid JSON
+            (orjson's decode error is a subclass)
+    """
+    tracking_fields = _json_loads(env().get('TRACKING_FIELDS', '{}'))
+    return MappingProxyType(tracking_fields) if isinstance(tracking_fields, dict) else tracking_fields
@@ -0,0 +1,72 @@
+"""Shared Jira client for the utility scripts.
+
+Every script that talks to Jira gets the same ``JIRA`` instance, so when
+several of them run in one process (for example under ``run_validation.py``)
+they reuse one pooled HTTP session instead of each opening new connections.
+The server's field list changes rarely, so it is cached on disk for an hour.
+"""
+
+import hashlib
+import json
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List
+
+from jira import JIRA
+from requests.adapters import HTTPAdapter
+
+from scripts.utils.env import env
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional
+    from json import loads as _json_loads
+
+# Large enough for the concurrent lookups in list_projects
+POOL_SIZE = 16
+
+CACHE_DIR = Path(".cache")
+FIELDS_CACHE_TTL = 3600  # seconds
+
+
+@lru_cache(maxsize=1)
+def get_client() -> JIRA:
+    """Create the Jira client on first use and return the shared instance."""
+    # The scripts don't depend on the server version or deployment type, so
+    # skip the serverInfo request the client would otherwise make up front
+    jira = JIRA(
+        server=env().get('JIRA_SERVER'),
+        basic_auth=(env().get('JIRA_USERNAME'), env().get('JIRA_API_TOKEN')),
+        get_server_info=False
+    )
+    jira._session.mount('https://', HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE))
+    return jira
+
+
+def get_fields(refresh: bool = False) -> List[Dict[str, Any]]:
+    """Return the Jira server's field definitions, as returned by ``JIRA.fields()``.
+
+    Args:
+        refresh: Skip the on-disk cache and fetch a fresh copy from Jira
+
+    Returns:
+        List of field definition dicts
+    """
+    server = env().get('JIRA_SERVER') or ''
+    server_hash = hashlib.sha1(server.encode()).hexdigest()[:12]
+    cache_file = CACHE_DIR / f"jira_fields_{server_hash}.json"
+    if not refresh:
+        try:
+            if time.time() - cache_file.stat().st_mtime < FIELDS_CACHE_TTL:
+                return _json_loads(cache_file.read_bytes())
+        except (OSError, ValueError):
+            pass  # Missing, unreadable or corrupt cache; fetch a fresh copy
+
+    fields = get_client().fields()
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        cache_file.write_text(json.dumps(fields))
+    except OSError:
+        pass  # Caching is best effort
+    return fields
@@ -1,19 +1,36 @@
-import os
-from jira import JIRA
-from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor
+
+from scripts.utils.env import env
+from scripts.utils.jira_client import POOL_SIZE, get_client
+
+# Role lookups are one request per project, so fetch them concurrently,
+# using as many workers as the shared client has pooled connections
+MAX_WORKERS = POOL_SIZE
+
+
+def _fetch_roles(jira, project_key):
+    """Fetch a project's roles, returning the exception instead of raising it."""
+    try:
+        return jira.project_roles(project_key)
+    except Exception as e:
+        return e
 
-load_dotenv()
 
 def main():
     print("Connecting to Jira...")
-    jira = JIRA(
-        server=os.getenv('JIRA_SERVER'),
-        basic_auth=(os.getenv('JIRA_USERNAME'), os.getenv('JIRA_API_TOKEN'))
-    )
+    jira = get_client()
+    
+    # The client doesn't contact the server until its first request, so
+    # confirm the URL and credentials before reporting success
+    try:
+        jira.myself()
+    except Exception as e:
+        print(f"\nError connecting to Jira: {str(e)}")
+        return
     
     print("\nJira connection successful")
-    print(f"Server: {os.getenv('JIRA_SERVER')}")
-    print(f"Username: {os.getenv('JIRA_USERNAME')}")
+    print(f"Server: {env().get('JIRA_SERVER')}")
+    print(f"Username: {env().get('JIRA_USERNAME')}")
     
     print("\nListing all accessible projects:")
     projects = jira.projects()
@@ -26,15 +43,17 @@ def main():
         print("3. The projects exist but are not visible to this user")
         return
     
-    for project in projects:
-        print(f"\nProject: {project.key}")
-        print(f"  Name: {project.name}")
-        print(f"  ID: {project.id}")
-        try:
-            roles = jira.project_roles(project.key)
-            print(f"  Roles: {', '.join(roles.keys())}")
-        except Exception as e:
-            print(f"  Couldn't fetch roles: {str(e)}")
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        all_roles = executor.map(lambda project: _fetch_roles(jira, project.key), projects)
+
+        for project, roles in zip(projects, all_roles):
+            print(f"\nProject: {project.key}")
+            print(f"  Name: {project.name}")
+            print(f"  ID: {project.id}")
+            if isinstance(roles, Exception):
+                print(f"  Couldn't fetch roles: {str(roles)}")
+            else:
+                print(f"  Roles: {', '.join(roles.keys())}")
 
 if __name__ == '__main__':
     main()
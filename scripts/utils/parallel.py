@@ -0,0 +1,97 @@
+"""Run independent checks concurrently while keeping each one's output together.
+
+Log records and ``print`` output produced on a worker thread are buffered per
+task instead of being written immediately, so the caller can print each task's
+output as one block, in a fixed order, once the checks have finished.
+"""
+
+import io
+import logging
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Sequence, Tuple
+
+# Output buffer of the task running on the current worker thread
+_current = threading.local()
+
+
+def _buffer():
+    return getattr(_current, 'buffer', None)
+
+
+def _not_captured(record: logging.LogRecord) -> bool:
+    """Handler filter that drops records which are being buffered for a task."""
+    return _buffer() is None
+
+
+class _BufferingHandler(logging.Handler):
+    """Append formatted log records to the current task's buffer."""
+
+    def emit(self, record):
+        buffer = _buffer()
+        if buffer is not None:
+            buffer.append(self.format(record) + '\n')
+
+
+class _ThreadStdout(io.TextIOBase):
+    """Send writes from task threads to their buffer and everything else to the real stdout."""
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, text):
+        buffer = _buffer()
+        if buffer is None:
+            return self._stream.write(text)
+        buffer.append(text)
+        return len(text)
+
+    def flush(self):
+        self._stream.flush()
+
+
+def _run(task: Callable[[], Any], buffer: List[str]) -> Any:
+    _current.buffer = buffer
+    try:
+        return task()
+    finally:
+        _current.buffer = None
+
+
+def run_concurrently(tasks: Sequence[Callable[[], Any]],
+                     fmt: str = '%(message)s') -> List[Tuple[Any, List[str]]]:
+    """Run tasks on a thread pool, capturing each one's log and stdout output.
+
+    Log records are captured only if the logging configuration would have
+    emitted them, and are kept away from the existing root handlers meanwhile.
+
+    Args:
+        tasks: Callables taking no arguments
+        fmt: Format for the captured log records
+
+    Returns:
+        (result, output lines) for each task, in the order the tasks were given
+    """
+    root = logging.getLogger()
+    handler = _BufferingHandler()
+    handler.setFormatter(logging.Formatter(fmt))
+    existing_handlers = list(root.handlers)
+    for existing in existing_handlers:
+        existing.addFilter(_not_captured)
+    root.addHandler(handler)
+    stdout = sys.stdout
+    sys.stdout = _ThreadStdout(stdout)
+
+    buffers = [[] for _ in tasks]
+    try:
+        with ThreadPoolExecutor(max_workers=max(len(tasks), 1)) as executor:
+            futures = [executor.submit(_run, task, buffer) for task, buffer in zip(tasks, buffers)]
+            results = [future.result() for future in futures]
+    finally:
+        sys.stdout = stdout
+        root.removeHandler(handler)
+        for existing in existing_handlers:
+            existing.removeFilter(_not_captured)
+
+    return [(result, ''.join(buffer).splitlines()) for result, buffer in zip(results, buffers)]
@@ -3,13 +3,19 @@ Validation scripts for the Jira to Airtable Mirror application.
 
 This module provides functions for validating various aspects of the application,
 including AWS setup, Docker configuration, and data schemas.
+
+Submodules are imported on first access, so using one validator doesn't pull in
+the dependencies (boto3, jira, pyairtable) of all the others.
 """
 
-from . import aws
-from . import config
-from . import docker
-from . import schema
-from . import jira_fields
-from . import tracking_fields
+import importlib
 
 __all__ = ['aws', 'config', 'docker', 'schema', 'jira_fields', 'tracking_fields']
+
+
+def __getattr__(name):
+    if name in __all__:
+        module = importlib.import_module(f'.{name}', __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
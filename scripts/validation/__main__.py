@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Run the data validators (Jira fields, Airtable schema and tracking fields) together.
+
+The validators make independent Jira and Airtable requests, so they run
+concurrently. Each validator's log output is collected separately and printed
+as one block once all of them have finished, so lines don't interleave.
+
+Usage:
+    python -m scripts.validation
+"""
+
+import logging
+import sys
+
+from scripts.utils.parallel import run_concurrently
+from scripts.validation import jira_fields, schema, tracking_fields
+
+VALIDATORS = (
+    ("Jira fields", jira_fields.validate_jira_fields),
+    ("Airtable schema", schema.validate_schema),
+    ("Tracking fields", tracking_fields.validate_tracking_fields),
+)
+
+
+def main():
+    """Run all data validators concurrently and report their results in order."""
+    logging.getLogger().setLevel(logging.INFO)
+    outcomes = run_concurrently([validator for _, validator in VALIDATORS])
+
+    for (name, _), (passed, lines) in zip(VALIDATORS, outcomes):
+        status = "✅" if passed else "❌"
+        print(f"\n{status} {name}")
+        for line in lines:
+            print(f"   {line}")
+
+    print()  # Add blank line at the end
+    return all(passed for passed, _ in outcomes)
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
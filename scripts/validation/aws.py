@@ -1,16 +1,51 @@
 #!/usr/bin/env python3
-import subprocess
 import sys
 import os
+import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 from typing import Tuple
 import boto3
+from botocore.exceptions import ClientError
+
+# Top-level "name = value" assignments in a .tfvars file
+_TFVARS_ASSIGNMENT = re.compile(r'^\s*([A-Za-z_][\w-]*)\s*=', re.MULTILINE)
+
+# Variables terraform.tfvars must set, and their descriptions
+_TFVARS_REQUIRED = MappingProxyType({
+    'aws_region': 'AWS region for deployment (e.g., us-west-2)',
+    'ecr_repository_name': 'Name for your ECR repository',
+    'jira_server': 'Your Jira server URL',
+    'jira_username': 'Your Jira username/email',
+    'jira_project_key': 'Your Jira project key',
+    'airtable_base_id': 'Your Airtable base ID',
+    'airtable_table_name': 'Your Airtable table name',
+    'jira_api_token_secret_arn': 'ARN of the secret containing your Jira API token',
+    'airtable_api_key_secret_arn': 'ARN of the secret containing your Airtable API key'
+})
+
+# (client name, read-only call) used to probe each service the deployment needs
+PERMISSION_PROBES = (
+    ('ecr', 'describe_repositories'),
+    ('lambda', 'list_functions'),
+    ('secretsmanager', 'list_secrets'),
+    ('events', 'list_rules'),
+)
 
 
 def check_aws_cli() -> Tuple[bool, str, str]:
     """Check if AWS CLI is installed and configured."""
+    if shutil.which('aws') is None:
+        return False, "AWS CLI is not installed", """
+        To fix:
+        1. Install AWS CLI:
+           - macOS: brew install awscli
+           - Other: https://aws.amazon.com/cli/
+        2. Run 'aws configure' to set up credentials
+        """
+
     try:
-        subprocess.run(['aws', '--version'], check=True, capture_output=True)
-        
         session = boto3.Session()
         credentials = session.get_credentials()
         if not credentials:
@@ -26,14 +61,6 @@ def check_aws_cli() -> Tuple[bool, str, str]:
         sts.get_caller_identity()
         
         return True, "AWS CLI is installed and configured", ""
-    except subprocess.CalledProcessError:
-        return False, "AWS CLI is not installed", """
-        To fix:
-        1. Install AWS CLI:
-           - macOS: brew install awscli
-           - Other: https://aws.amazon.com/cli/
-        2. Run 'aws configure' to set up credentials
-        """
     except Exception as e:
         return False, "AWS CLI error: " + str(e), """
         To fix:
@@ -45,10 +72,7 @@ def check_aws_cli() -> Tuple[bool, str, str]:
 
 def check_terraform() -> Tuple[bool, str, str]:
     """Check if Terraform is installed."""
-    try:
-        subprocess.run(['terraform', '--version'], check=True, capture_output=True)
-        return True, "Terraform is installed", ""
-    except FileNotFoundError:
+    if shutil.which('terraform') is None:
         return False, "Terraform is not installed", """
         To fix:
         1. Install Terraform:
@@ -56,12 +80,7 @@ def check_terraform() -> Tuple[bool, str, str]:
            - Other: https://developer.hashicorp.com/terraform/downloads
         2. Verify installation: terraform --version
         """
-    except subprocess.CalledProcessError as e:
-        return False, "Terraform error: " + str(e), """
-        To fix:
-        1. Try reinstalling Terraform
-        2. Check if Terraform binary is corrupted
-        """
+    return True, "Terraform is installed", ""
 
 
 def check_terraform_config() -> Tuple[bool, str, str]:
@@ -69,24 +88,11 @@ def check_terraform_config() -> Tuple[bool, str, str]:
     tfvars_path = os.path.join('terraform', 'aws', 'terraform.tfvars')
     try:
         with open(tfvars_path, 'r') as f:
-            tfvars_content = f.read()
+            assigned_vars = set(_TFVARS_ASSIGNMENT.findall(f.read()))
         
-        required_vars = {
-            'aws_region': 'AWS region for deployment (e.g., us-west-2)',
-            'ecr_repository_name': 'Name for your ECR repository',
-            'jira_server': 'Your Jira server URL',
-            'jira_username': 'Your Jira username/email',
-            'jira_project_key': 'Your Jira project key',
-            'airtable_base_id': 'Your Airtable base ID',
-            'airtable_table_name': 'Your Airtable table name',
-            'jira_api_token_secret_arn': 'ARN of the secret containing your Jira API token',
-            'airtable_api_key_secret_arn': 'ARN of the secret containing your Airtable API key'
-        }
-        
-        missing_vars = []
-        for var, description in required_vars.items():
-            if var not in tfvars_content:
-                missing_vars.append("- " + var + ": " + description)
+        missing_vars = ["- " + var + ": " + description
+                        for var, description in _TFVARS_REQUIRED.items()
+                        if var not in assigned_vars]
         
         if missing_vars:
             fix_instructions = """
@@ -112,27 +118,52 @@ def check_terraform_config() -> Tuple[bool, str, str]:
         """
 
 
+def _probe_permission(client, operation: str):
+    """Call a read-only operation, returning the exception instead of raising it."""
+    try:
+        getattr(client, operation)()
+    except Exception as e:
+        return e
+    return None
+
+
+def _describe_error(error: Exception) -> str:
+    """Summarize a probe failure, using the AWS error code when there is one."""
+    if isinstance(error, ClientError):
+        return error.response.get('Error', {}).get('Code', str(error))
+    return str(error)
+
+
 def check_aws_permissions() -> Tuple[bool, str, str]:
     """Check if AWS user has required permissions."""
     try:
+        # boto3 sessions aren't thread-safe, so create the clients up front;
+        # the clients themselves can then be called from worker threads
         session = boto3.Session()
-        
-        ecr = session.client('ecr')
-        ecr.describe_repositories()
-        
-        lambda_client = session.client('lambda')
-        lambda_client.list_functions()
-        
-        secrets = session.client('secretsmanager')
-        secrets.list_secrets()
-        
-        events = session.client('events')
-        events.list_rules()
-        
-        return True, "AWS user has required permissions", ""
+        clients = [session.client(service) for service, _ in PERMISSION_PROBES]
     except Exception as e:
-        service = str(e).split('.')[0] if '.' in str(e) else 'unknown'
-        return False, "Missing AWS permissions: " + str(e), """
+        return False, "Could not create AWS clients: " + str(e), """
+        To fix:
+        1. Run 'aws configure' and set a default region (e.g., us-west-2)
+        """
+
+    # The probes are independent round trips, so run them concurrently
+    with ThreadPoolExecutor(max_workers=len(PERMISSION_PROBES)) as executor:
+        results = list(executor.map(
+            _probe_permission, clients, [operation for _, operation in PERMISSION_PROBES]
+        ))
+
+    failures = [
+        (service, error)
+        for (service, _), error in zip(PERMISSION_PROBES, results)
+        if error is not None
+    ]
+    if not failures:
+        return True, "AWS user has required permissions", ""
+
+    services = ", ".join(service for service, _ in failures)
+    details = "; ".join(f"{service}: {_describe_error(error)}" for service, error in failures)
+    return False, "Missing AWS permissions: " + details, """
         To fix:
         1. Ensure your AWS user has these permissions:
            - Amazon ECR: Full access
@@ -140,7 +171,7 @@ def check_aws_permissions() -> Tuple[bool, str, str]:
            - AWS Secrets Manager: Read access
            - Amazon EventBridge: Full access
         
-        2. Add missing permissions for """ + service + """ :
+        2. Add missing permissions for """ + services + """ :
            - Ask your AWS administrator to grant necessary permissions
            - Or update your IAM policy to include required actions
         """
@@ -149,26 +180,28 @@ def check_aws_permissions() -> Tuple[bool, str, str]:
 def run_aws_validation():
     """Run all AWS validation checks and return the results."""
     checks = [
-        ("AWS CLI", check_aws_cli()),
-        ("Terraform", check_terraform()),
-        ("Terraform Configuration", check_terraform_config()),
-        ("AWS Permissions", check_aws_permissions())
+        ("AWS CLI", check_aws_cli),
+        ("Terraform", check_terraform),
+        ("Terraform Configuration", check_terraform_config),
+        ("AWS Permissions", check_aws_permissions)
     ]
     
     all_passed = True
-    first = True
     
-    for name, (passed, message, fix) in checks:
-        status = "✅" if passed else "❌"
-        if first:
-            print(f"\n   {status} {name}:")
-            first = False
-        else:
+    # Run the checks concurrently and print each result as soon as it (and every
+    # check listed before it) has finished, so output streams in a stable order
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = [(name, executor.submit(check)) for name, check in checks]
+        for name, future in futures:
+            passed, message, fix = future.result()
+            status = "✅" if passed else "❌"
             print(f"\n   {status} {name}:")
-        print(f"      {message}")
-        
-        if not passed and fix:
-            print(f"      {fix}")
+            print(f"      {message}", flush=True)
+            
+            if not passed:
+                all_passed = False
+                if fix:
+                    print(f"      {fix}", flush=True)
     
     print()  # Add blank line at the end
     return all_passed
@@ -1,21 +1,52 @@
 #!/usr/bin/env python3
+import io
 import os
 import json
+import re
 import sys
 import logging
-from typing import List, Tuple, Dict, Any
+from types import MappingProxyType
+from typing import Any, List, Mapping, Tuple
 import shutil
-from dotenv import load_dotenv
+from scripts.utils.env import env, get_field_map
 
 logger = logging.getLogger(__name__)
 
-
-def validate_field_mapping_schema(field_map: Dict[str, Any]) -> Tuple[bool, List[str]]:
+# Airtable field IDs are 'fld' followed by 14 letters or digits
+_FIELD_ID_PATTERN = re.compile(r'fld[A-Za-z0-9]{14}')
+
+ENV_CREATED_MESSAGE = "Created .env from .env.example"
+
+# Required environment variables and their descriptions
+_JIRA_REQUIRED = MappingProxyType({
+    'JIRA_SERVER': 'Your Jira server URL',
+    'JIRA_USERNAME': 'Your Jira username/email',
+    'JIRA_API_TOKEN': 'Your Jira API token',
+    'JIRA_PROJECT_KEY': 'Your Jira project key'
+})
+_AIRTABLE_REQUIRED = MappingProxyType({
+    'AIRTABLE_API_KEY': 'Your Airtable API key',
+    'AIRTABLE_BASE_ID': 'Your Airtable base ID',
+    'AIRTABLE_TABLE_NAME': 'Your Airtable table name'
+})
+
+# Jira fields every field mapping must include
+_REQUIRED_JIRA_FIELDS = MappingProxyType({
+    'summary': 'Issue summary/title',
+    'description': 'Issue description',
+    'status': 'Issue status',
+    'issuetype': 'Issue type',
+    'created': 'Creation date',
+    'updated': 'Last update date'
+})
+
+
+def validate_field_mapping_schema(field_map: Mapping[str, Any]) -> Tuple[bool, List[str]]:
     """Validate the schema of field mappings."""
     errors = []
     
     # Check if field_map is a dictionary
-    if not isinstance(field_map, dict):
+    if not isinstance(field_map, Mapping):
         errors.append(f"Field mappings must be a dictionary, got: {type(field_map)}")
         return False, errors
 
@@ -24,29 +55,15 @@ def validate_field_mapping_schema(field_map: Dict[str, Any]) -> Tuple[bool, List
         errors.append("Field mappings dictionary is empty")
         return False, errors
 
-    # Required Jira fields that should be mapped
-    required_fields = {
-        'summary': 'Issue summary/title',
-        'description': 'Issue description',
-        'status': 'Issue status',
-        'issuetype': 'Issue type',
-        'created': 'Creation date',
-        'updated': 'Last update date'
-    }
-    
-    # Check for missing required fields
-    missing_fields = [f"{field} ({desc})" for field, desc in required_fields.items() 
-                     if field not in field_map]
-    if missing_fields:
+    # Check for missing required fields; descriptions are only formatted when some are missing
+    missing = _REQUIRED_JIRA_FIELDS.keys() - field_map.keys()
+    if missing:
+        missing_fields = [f"{field} ({desc})" for field, desc in _REQUIRED_JIRA_FIELDS.items()
+                          if field in missing]
         errors.append("Missing required Jira field mappings:\n      - " + 
                      "\n      - ".join(missing_fields))
     
     for jira_field, airtable_info in field_map.items():
-        # Check if Jira field name is a string
-        if not isinstance(jira_field, str):
-            errors.append(f"Jira field must be a string, got: {type(jira_field)}")
-            continue
-            
         # Check if airtable_info is a dictionary with required structure
         if not isinstance(airtable_info, dict):
             errors.append(f"Mapping for '{jira_field}' must be a dictionary with 'airtable_field_id', got: {type(airtable_info)}")
@@ -63,21 +80,28 @@ def validate_field_mapping_schema(field_map: Dict[str, Any]) -> Tuple[bool, List
             errors.append(f"Airtable field ID for '{jira_field}' must be a string, got: {type(field_id)}")
             continue
             
-        # Validate Airtable field ID format (should start with 'fld')
-        if not field_id.startswith('fld'):
-            errors.append(f"Invalid Airtable field ID format for '{jira_field}': {field_id} (should start with 'fld')")
+        # Validate Airtable field ID format
+        if not _FIELD_ID_PATTERN.fullmatch(field_id):
+            errors.append(
+                f"Invalid Airtable field ID format for '{jira_field}': {field_id} "
+                "(should be 'fld' followed by 14 letters or digits)"
+            )
     
     return len(errors) == 0, errors
 
 
 def check_env_file() -> Tuple[bool, str, str]:
     """Check if .env file exists and create it from example if not."""
-    if os.path.exists('.env'):
+    # One directory listing answers both existence checks
+    with os.scandir('.') as entries:
+        env_files = {entry.name for entry in entries if entry.name in ('.env', '.env.example')}
+
+    if '.env' in env_files:
         return True, "Environment file exists", ""
     
-    if os.path.exists('.env.example'):
+    if '.env.example' in env_files:
         shutil.copy('.env.example', '.env')
-        return False, "Created .env from .env.example", """
+        return False, ENV_CREATED_MESSAGE, """
         Action required:
         1. A new .env file has been created from .env.example
         2. Please edit .env and fill in your configuration values
@@ -95,17 +119,9 @@ def check_env_file() -> Tuple[bool, str, str]:
 
 def check_jira_config() -> Tuple[bool, str, List[str]]:
     """Validate Jira configuration."""
-    required_vars = {
-        'JIRA_SERVER': 'Your Jira server URL',
-        'JIRA_USERNAME': 'Your Jira username/email',
-        'JIRA_API_TOKEN': 'Your Jira API token',
-        'JIRA_PROJECT_KEY': 'Your Jira project key'
-    }
-    
-    missing_vars = []
-    for var, description in required_vars.items():
-        if not os.getenv(var):
-            missing_vars.append(f"{var}: {description}")
+    environ = env()
+    missing_vars = [f"{var}: {description}" for var, description in _JIRA_REQUIRED.items()
+                    if not environ.get(var)]
     
     if missing_vars:
         return False, "Missing Jira configuration", missing_vars
@@ -114,16 +130,9 @@ def check_jira_config() -> Tuple[bool, str, List[str]]:
 
 def check_airtable_config() -> Tuple[bool, str, List[str]]:
     """Validate Airtable configuration."""
-    required_vars = {
-        'AIRTABLE_API_KEY': 'Your Airtable API key',
-        'AIRTABLE_BASE_ID': 'Your Airtable base ID',
-        'AIRTABLE_TABLE_NAME': 'Your Airtable table name'
-    }
-    
-    missing_vars = []
-    for var, description in required_vars.items():
-        if not os.getenv(var):
-            missing_vars.append(f"{var}: {description}")
+    environ = env()
+    missing_vars = [f"{var}: {description}" for var, description in _AIRTABLE_REQUIRED.items()
+                    if not environ.get(var)]
     
     if missing_vars:
         return False, "Missing Airtable configuration", missing_vars
@@ -133,7 +142,7 @@ def check_airtable_config() -> Tuple[bool, str, List[str]]:
 def check_field_mappings() -> Tuple[bool, str, str]:
     """Validate field mappings configuration."""
     try:
-        raw_value = os.getenv('JIRA_TO_AIRTABLE_FIELD_MAP')
+        raw_value = env().get('JIRA_TO_AIRTABLE_FIELD_MAP')
         if not raw_value:
             return False, "No field mappings found", """
             To fix:
@@ -157,7 +166,7 @@ def check_field_mappings() -> Tuple[bool, str, str]:
             """
         
         try:
-            field_map = json.loads(raw_value)
+            field_map = get_field_map()
         except json.JSONDecodeError as e:
             return False, "Invalid JSON in field mappings", f"""
             JSON parsing error: {str(e)}
@@ -193,7 +202,7 @@ def check_field_mappings() -> Tuple[bool, str, str]:
             
             Note:
             - Each Jira field must map to a dictionary containing 'airtable_field_id'
-            - All Airtable field IDs must start with 'fld'
+            - All Airtable field IDs must be 'fld' followed by 14 letters or digits
             - Required Jira fields: summary, description, status, issuetype, created, updated
             """
         
@@ -209,30 +218,30 @@ def check_field_mappings() -> Tuple[bool, str, str]:
 
 def main():
     """Run all configuration validation checks."""
-    load_dotenv()
-    
     checks = [
-        ("Environment File", check_env_file()),
-        ("Jira Configuration", check_jira_config()),
-        ("Airtable Configuration", check_airtable_config()),
-        ("Field Mappings", check_field_mappings())
+        ("Environment File", check_env_file),
+        ("Jira Configuration", check_jira_config),
+        ("Airtable Configuration", check_airtable_config),
+        ("Field Mappings", check_field_mappings)
     ]
     
+    # Build the report in memory and write it in one call
+    out = io.StringIO()
     all_passed = True
-    first = True
     
-    for name, (passed, message, _) in checks:
+    for name, check in checks:
+        passed, message, _ = check()
         status = "✅" if passed else "❌"
-        if first:
-            print(f"\n   {status} {name}:")
-            first = False
-        else:
-            print(f"\n   {status} {name}:")
-        print(f"      {message}")
+        print(f"\n   {status} {name}:", file=out)
+        print(f"      {message}", file=out)
         if not passed:
             all_passed = False
+            # A freshly copied .env only holds placeholders, so the remaining checks can't pass
+            if message == ENV_CREATED_MESSAGE:
+                break
     
-    print()  # Add blank line at the end
+    print(file=out)  # Add blank line at the end
+    sys.stdout.write(out.getvalue())
     return all_passed
 
 
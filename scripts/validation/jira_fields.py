@@ -1,91 +1,64 @@
 #!/usr/bin/env python3
-import os
 import sys
-import json
+import argparse
 import logging
-from dotenv import load_dotenv
-from jira import JIRA
-from sync import JiraAirtableSync
+from collections import Counter
+from operator import attrgetter
+from typing import List
+from scripts.utils.env import env, get_field_map
+from scripts.utils.jira_client import get_client, get_fields
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO)
-handler = logging.StreamHandler()
-handler.setFormatter(logging.Formatter('%(levelname)s:%(name)s:%(message)s'))
-logger.addHandler(handler)
 
 
-def validate_jira_fields() -> bool:
-    """Validate that all JIRA fields in our mapping can be retrieved."""
+def _log_summary(successes: List[str], warnings: List[str], errors: List[str]) -> bool:
+    """Log the per-field results as a single record and return whether there were no errors.
+
+    Successful checks are only listed when debug logging is enabled.
+    """
+    lines = [f"Field validation summary: ✅ {len(successes)} ok, ⚠️  {len(warnings)} warnings, ❌ {len(errors)} errors"]
+    if logger.isEnabledFor(logging.DEBUG):
+        lines.extend(f"  {line}" for line in successes)
+    lines.extend(f"  {line}" for line in warnings)
+    lines.extend(f"  {line}" for line in errors)
+    level = logging.ERROR if errors else logging.WARNING if warnings else logging.INFO
+    logger.log(level, "\n".join(lines))
+    return not errors
+
+
+def validate_jira_fields(refresh_schema: bool = False) -> bool:
+    """Validate that all JIRA fields in our mapping can be retrieved.
+
+    Args:
+        refresh_schema: Fetch Jira's field list fresh instead of using the cached copy
+    """
+    successes, warnings, errors = [], [], []
     try:
-        # Load environment variables
-        load_dotenv()
-        
         # Initialize JIRA client for schema lookup
-        jira = JIRA(
-            server=os.getenv('JIRA_SERVER'),
-            basic_auth=(os.getenv('JIRA_USERNAME'), os.getenv('JIRA_API_TOKEN'))
-        )
+        jira = get_client()
         
-        # Get all JIRA fields for reference
-        all_fields = jira.fields()
-        logger.info("Available JIRA fields:")
-        for field in sorted(all_fields, key=lambda x: x['name']):
-            logger.info(f"  - {field['name']} (id: {field['id']})")
-        logger.info("---")
+        # Get all JIRA fields for reference (cached on disk between runs)
+        all_fields = get_fields(refresh=refresh_schema)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Available JIRA fields:")
+            for field in sorted(all_fields, key=lambda x: x['name']):
+                logger.debug(f"  - {field['name']} (id: {field['id']})")
+            logger.debug("---")
         
         # Load field mappings
-        field_map = json.loads(os.getenv('JIRA_TO_AIRTABLE_FIELD_MAP', '{}'))
+        field_map = get_field_map()
         if not field_map:
             logger.error("❌ JIRA_TO_AIRTABLE_FIELD_MAP not found in environment")
             return False
             
-        # Build maps of field IDs to names
-        jira_fields = {}
+        # Collect all field IDs and the names of custom fields in one pass
+        jira_fields = set()
+        custom_field_ids = {}
         for field in all_fields:
-            jira_fields[field['id']] = field['id']
-        custom_field_ids = {field['id']: field['name'] for field in all_fields}
-        
-        # Initialize the sync handler to use its methods
-        config = {
-            'jira': {
-                'server': os.getenv('JIRA_SERVER'),
-                'username': os.getenv('JIRA_USERNAME'),
-                'api_token': os.getenv('JIRA_API_TOKEN'),
-                'project_key': os.getenv('JIRA_PROJECT_KEY')
-            },
-            'airtable': {
-                'api_key': os.getenv('AIRTABLE_API_KEY'),
-                'base_id': os.getenv('AIRTABLE_BASE_ID'),
-                'table_id': os.getenv('AIRTABLE_TABLE_NAME')
-            },
-            'field_mappings': field_map
-        }
-        sync_handler = JiraAirtableSync(config)
-        
-        # Get test issues using the sync handler
-        max_results = 20
-        logger.info(f"Fetching up to {max_results} issues for testing")
-        
-        try:
-            issues = sync_handler.get_jira_issues(max_results=max_results)
-        except Exception as e:
-            logger.error(f"❌ Error fetching JIRA issues: {str(e)}")
-            return False
-            
-        if not issues:
-            logger.error("❌ No JIRA issues found to validate fields against")
-            return False
-        
-        if len(issues) < max_results:
-            logger.warning(f"⚠️  Only found {len(issues)} issues to test against")
-            
-        logger.info("Testing against the following issues:")
-        for issue in issues:
-            logger.info(f"  - {issue.key}")
-        logger.info("---")
-        
-        # Track field statistics across all test issues
-        field_stats = {}  # field_name -> {'present': count, 'non_null': count}
+            field_id = field['id']
+            jira_fields.add(field_id)
+            if field_id.startswith('customfield_'):
+                custom_field_ids[field_id] = field['name']
         
         # Special computed fields that we handle in the sync code
         computed_fields = {
@@ -100,8 +73,8 @@ def validate_jira_fields() -> bool:
             'key': 'Issue key field - accessed directly on issue'
         }
         
-        # Check each mapped JIRA field
-        success = True
+        # Check each mapped JIRA field, collecting the ones to sample from the test issues
+        fields_to_check = []
         for jira_field, airtable_field in field_map.items():
             # Skip special fields that aren't direct JIRA fields
             if jira_field.startswith('_'):
@@ -109,66 +82,92 @@ def validate_jira_fields() -> bool:
                 
             # Handle computed fields
             if jira_field in computed_fields:
-                logger.info(f"✅ Found computed field '{jira_field}' ({computed_fields[jira_field]})")
+                successes.append(f"✅ Found computed field '{jira_field}' ({computed_fields[jira_field]})")
                 continue
                 
             # Handle special fields
             if jira_field in special_fields:
-                logger.info(f"✅ Found special field '{jira_field}' ({special_fields[jira_field]})")
+                successes.append(f"✅ Found special field '{jira_field}' ({special_fields[jira_field]})")
                 continue
                 
             # Handle custom fields
             if jira_field.startswith('customfield_'):
                 if jira_field not in custom_field_ids:
-                    logger.error(f"❌ Custom JIRA field '{jira_field}' (mapped to Airtable '{airtable_field}') does not exist")
-                    success = False
+                    errors.append(f"❌ Custom JIRA field '{jira_field}' (mapped to Airtable '{airtable_field}') does not exist")
                     continue
-                logger.info(f"✅ Found custom field '{jira_field}' ({custom_field_ids[jira_field]})")
+                successes.append(f"✅ Found custom field '{jira_field}' ({custom_field_ids[jira_field]})")
             
             # For standard fields, check if they exist
             elif jira_field not in jira_fields:
-                logger.error(f"❌ JIRA field '{jira_field}' (mapped to Airtable '{airtable_field}') does not exist")
-                success = False
+                errors.append(f"❌ JIRA field '{jira_field}' (mapped to Airtable '{airtable_field}') does not exist")
                 continue
             
-            # Initialize stats for this field
-            field_stats[jira_field] = {'present': 0, 'non_null': 0}
+            fields_to_check.append(jira_field)
+        
+        # Fetch test issues with only the fields being checked, so Jira doesn't
+        # serialize every field of every issue
+        environ = env()
+        jql = f"project = {environ.get('JIRA_PROJECT_KEY')}"
+        jql_filter = environ.get('JIRA_JQL_FILTER')
+        if jql_filter:
+            jql += f" AND ({jql_filter})"
+        max_results = 20
+        logger.info(f"Fetching up to {max_results} issues for testing")
+        
+        try:
+            issues = jira.search_issues(
+                jql,
+                maxResults=max_results,
+                fields=",".join(fields_to_check) or "key"
+            )
+        except Exception as e:
+            errors.append(f"❌ Error fetching JIRA issues: {str(e)}")
+            return _log_summary(successes, warnings, errors)
             
-            # Try to access the field in all test issues
+        if not issues:
+            errors.append("❌ No JIRA issues found to validate fields against")
+            return _log_summary(successes, warnings, errors)
+        
+        if len(issues) < max_results:
+            warnings.append(f"⚠️  Only found {len(issues)} issues to test against")
+            
+        logger.info(f"Testing against issues: {', '.join(issue.key for issue in issues)}")
+        
+        # Count non-null values per field, reading all checked fields from each
+        # issue in a single attrgetter call
+        non_null = Counter()
+        if fields_to_check:
+            getter = attrgetter(*fields_to_check)
+            get_values = getter if len(fields_to_check) > 1 else lambda fields: (getter(fields),)
             for issue in issues:
                 try:
-                    # Special handling for 'key' field which is accessed directly on the issue
-                    if jira_field == 'key':
-                        field_value = issue.key
-                    else:
-                        field_value = getattr(issue.fields, jira_field, None)
-                    
-                    field_stats[jira_field]['present'] += 1
-                    if field_value is not None:
-                        field_stats[jira_field]['non_null'] += 1
-                except Exception as e:
-                    logger.error(f"❌ Error accessing JIRA field '{jira_field}' in issue {issue.key}: {str(e)}")
-                    success = False
-            
-            # Report field statistics
-            stats = field_stats[jira_field]
-            total_issues = len(issues)
-            
-            if stats['present'] == 0:
-                logger.error(f"❌ JIRA field '{jira_field}' not found in any test issues")
-                success = False
-            elif stats['non_null'] == 0:
-                logger.warning(f"⚠️  JIRA field '{jira_field}' exists but is null in all {total_issues} test issues")
+                    values = get_values(issue.fields)
+                except AttributeError:
+                    # Jira omits unset fields, so fall back to per-field lookups for this issue
+                    values = [getattr(issue.fields, jira_field, None) for jira_field in fields_to_check]
+                non_null.update(
+                    jira_field for jira_field, value in zip(fields_to_check, values) if value is not None
+                )
+        
+        # Report field statistics
+        total_issues = len(issues)
+        for jira_field in fields_to_check:
+            if non_null[jira_field] == 0:
+                warnings.append(f"⚠️  JIRA field '{jira_field}' exists but is null in all {total_issues} test issues")
             else:
-                logger.info(f"✅ Successfully accessed JIRA field '{jira_field}' (non-null in {stats['non_null']}/{total_issues} issues)")
+                successes.append(f"✅ Successfully accessed JIRA field '{jira_field}' (non-null in {non_null[jira_field]}/{total_issues} issues)")
 
-        return success
+        return _log_summary(successes, warnings, errors)
 
     except Exception as e:
-        logger.error(f"❌ Error validating JIRA fields: {str(e)}")
-        return False
+        errors.append(f"❌ Error validating JIRA fields: {str(e)}")
+        return _log_summary(successes, warnings, errors)
 
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Validate the mapped JIRA fields')
+    parser.add_argument('--refresh-schema', action='store_true',
+                       help="Ignore the cached JIRA field list and fetch it again")
+    args = parser.parse_args()
     logging.basicConfig(level=logging.INFO)
-    sys.exit(0 if validate_jira_fields() else 1)
+    sys.exit(0 if validate_jira_fields(refresh_schema=args.refresh_schema) else 1)
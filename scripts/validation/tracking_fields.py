@@ -1,10 +1,8 @@
 #!/usr/bin/env python3
-import os
 import sys
-import json
 import logging
-from dotenv import load_dotenv
-from pyairtable import Api
+from scripts.utils.airtable import get_table
+from scripts.utils.env import env, get_tracking_fields
 
 logger = logging.getLogger(__name__)
 
@@ -12,39 +10,27 @@ logger = logging.getLogger(__name__)
 def validate_tracking_fields():  # noqa: C901
     """Validate tracking field configuration."""
     try:
-        load_dotenv()
-
-        # Initialize Airtable client
-        api = Api(os.getenv('AIRTABLE_API_KEY'))
-        base_id = os.getenv('AIRTABLE_BASE_ID')
-        table_name = os.getenv('AIRTABLE_TABLE_NAME')
+        environ = env()
+        api_key = environ.get('AIRTABLE_API_KEY')
+        base_id = environ.get('AIRTABLE_BASE_ID')
+        table_name = environ.get('AIRTABLE_TABLE_NAME')
 
         # Get tracking field configuration
-        tracking_fields = json.loads(os.getenv('TRACKING_FIELDS', '{}'))
+        tracking_fields = get_tracking_fields()
         if not tracking_fields:
             logger.info("No tracking fields configured")
             return True
 
-        # Get table metadata
-        table_info = api.request(
-            method="GET",
-            url=f"https://api.airtable.com/v0/meta/bases/{base_id}/tables"
-        )
-
-        # Find our table
-        table_meta = None
-        for table in table_info["tables"]:
-            if table["name"] == table_name:
-                table_meta = table
-                break
+        # Get our table's metadata
+        table_meta = get_table(api_key, base_id, table_name)
 
         if not table_meta:
             logger.error(f"Table '{table_name}' not found in Airtable base")
             return False
 
         # Get field IDs and names
-        field_ids = {field["id"] for field in table_meta["fields"]}
         field_names = {field["id"]: field["name"] for field in table_meta["fields"]}
+        field_ids = field_names.keys()
 
         # Check each tracking field
         invalid_fields = []
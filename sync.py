@@ -4,7 +4,7 @@ import time
 from datetime import datetime
 from functools import wraps
 from logging import getLogger
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 import pytz
 from jira import JIRA
@@ -68,9 +68,17 @@ class JiraAirtableSync:
         logger.debug(f"Environment variables: {dict(os.environ)}")
 
     def _init_field_mappings(self) -> Dict[str, Dict[str, str]]:
-        """Initialize field mappings from configuration."""
+        """Initialize field mappings from configuration.
+
+        Each mapping is copied because the parsed config may be shared (and is
+        reused across warm Lambda invocations), while this instance fills in
+        Airtable field names.
+        """
         logger.debug("Initializing field mappings")
-        return self.config.field_mappings
+        return {
+            jira_field: dict(mapping) if isinstance(mapping, dict) else mapping
+            for jira_field, mapping in self.config.field_mappings.items()
+        }
 
     def _get_jira_timezone(self) -> str:
         """Get the timezone setting from Jira instance."""
@@ -245,10 +253,36 @@ class JiraAirtableSync:
             return None
 
     @retry_with_backoff(retries=3, backoff_in_seconds=1)
-    def _fetch_updated_jira_issues(self) -> List[Any]:
+    def _count_jira_issues(self, jql: str) -> int:
+        """Return the number of Jira issues matching a JQL query."""
+        return self.jira.search_issues(jql, maxResults=0).total
+
+    @retry_with_backoff(retries=3, backoff_in_seconds=1)
+    def _fetch_jira_issue_page(self, jql: str, start_at: int, max_results: int) -> List[Any]:
+        """
+        Fetch one page of Jira issues matching a JQL query.
+
+        Args:
+            jql: JQL query
+            start_at: Index of the first issue to return
+            max_results: Maximum number of issues to return
+
+        Returns:
+            List of Jira issues, including their changelog and comments
+        """
+        return self.jira.search_issues(
+            jql,
+            startAt=start_at,
+            maxResults=max_results,
+            expand=['changelog'],  # Include changelog for additional fields
+            fields='*all,comment'  # Include all fields and comments
+        )
+
+    def _iter_updated_jira_issues(self) -> Iterator[Any]:
         """
-        Fetch all Jira issues that have been updated since the last sync.
-        Uses pagination to ensure all matching issues are retrieved.
+        Yield all Jira issues that have been updated since the last sync.
+        Issues are fetched a page at a time and yielded as each page arrives,
+        so only one page of raw issues is held in memory at once.
         Orders issues by key to ensure consistent processing order.
         """
         last_sync = self._get_most_recent_jira_update_time()
@@ -268,11 +302,11 @@ class JiraAirtableSync:
         logger.debug(f"Fetching Jira issues with JQL: {jql}")
         
         # Get total issue count first
-        total_issues = self.jira.search_issues(jql, maxResults=0).total
+        total_issues = self._count_jira_issues(jql)
         logger.info(f"Total Jira issues to fetch: {total_issues}")
         
         # Fetch issues in batches
-        all_issues = []
+        fetched_count = 0
         total_bytes = 0
         start_at = 0
         max_results = int(os.getenv('MAX_RESULTS', '100'))
@@ -281,52 +315,53 @@ class JiraAirtableSync:
             end_at = min(start_at + max_results, total_issues)
             logger.info(f"Fetching Jira issues {start_at + 1} to {end_at} of {total_issues}")
             
-            batch = self.jira.search_issues(
-                jql,
-                startAt=start_at,
-                maxResults=max_results,
-                expand=['changelog'],  # Include changelog for additional fields
-                fields='*all,comment'  # Include all fields and comments
-            )
+            batch = self._fetch_jira_issue_page(jql, start_at, max_results)
+            if not batch:
+                break  # Fewer issues matched than counted (e.g. deleted mid-sync)
             batch_size = sum(len(str(issue.raw)) for issue in batch)
             total_bytes += batch_size
             logger.info(f"Retrieved {len(batch)} issues ({self._format_bytes(batch_size)})")
             
-            all_issues.extend(batch)
+            yield from batch
+            fetched_count += len(batch)
             start_at += len(batch)  # Use actual batch size for pagination
             
-        logger.info(f"Successfully retrieved {len(all_issues)} issues (Total size: {self._format_bytes(total_bytes)})")
-        return all_issues
+        logger.info(f"Successfully retrieved {fetched_count} issues (Total size: {self._format_bytes(total_bytes)})")
 
     @retry_with_backoff(retries=3, backoff_in_seconds=1)
-    def _batch_create_with_progress(self, records: List[Dict[str, Any]]) -> Tuple[int, List[Dict[str, Any]]]:
+    def _batch_upsert_with_progress(self, records: List[Dict[str, Any]],
+                                    key_field_id: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
         """
-        Create records in batches with progress tracking and error handling.
-        
+        Upsert records in batches, matching existing records on the Jira key field.
+
+        Airtable creates records whose key isn't in the table yet and updates the
+        rest, so no separate lookup is needed to tell new issues from existing ones.
+
         Args:
-            records: List of records to create
-            
+            records: List of records to upsert, each a dict with a 'fields' key
+            key_field_id: Airtable field ID of the Jira key field to merge on
+
         Returns:
-            Tuple containing count of created records and list of failed records
+            Tuple containing the list of upserted records and list of failed records
         """
-        created_count = 0
+        upserted = []
         failed_records = []
         
         try:
-            created = self.table.batch_create(records)
-            created_count = len(created)
+            result = self.table.batch_upsert(records, key_fields=[key_field_id], use_field_ids=True)
+            upserted = result['records']
         except Exception as e:
-            logger.error(f"Error in batch creation: {str(e)}")
-            # If the batch fails, try creating records one by one to identify problematic records
+            logger.error(f"Error in batch upsert: {str(e)}")
+            # If the batch fails, try upserting records one by one to identify problematic records
             for record in records:
                 try:
-                    self.table.create(record)
-                    created_count += 1
+                    result = self.table.batch_upsert([record], key_fields=[key_field_id], use_field_ids=True)
+                    upserted.extend(result['records'])
                 except Exception as record_error:
-                    logger.warning(f"Failed to create record: {str(record_error)}")
+                    logger.warning(f"Failed to upsert record: {str(record_error)}")
                     failed_records.append(record)
         
-        return created_count, failed_records
+        return upserted, failed_records
 
     @retry_with_backoff(retries=3, backoff_in_seconds=1)
     def _batch_update_with_progress(self, batch: List[Union[Dict, Tuple]], include_keys: bool = False) -> Tuple[int, List[str]]:
@@ -476,19 +511,21 @@ class JiraAirtableSync:
             logger.debug(f"[{issue.key}] No changelog found")
             return None
 
-        status_changes = [
-            (history.created, item)
-            for history in issue.changelog.histories
-            for item in history.items if item.field == 'status'
-        ]
-        logger.debug(f"[{issue.key}] Found {len(status_changes)} status changes")
-        if status_changes:
-            # Sort by created date to get the most recent
-            status_changes.sort(key=lambda x: x[0])
-            latest_update_time = status_changes[-1][0]
+        # Only the most recent status change is needed, so take the max creation
+        # time in one pass instead of collecting and sorting every change
+        latest_update_time = max(
+            (
+                history.created
+                for history in issue.changelog.histories
+                if any(item.field == 'status' for item in history.items)
+            ),
+            default=None
+        )
+        if latest_update_time:
             logger.debug(f"[{issue.key}] Latest status change time: {latest_update_time}")
-            return latest_update_time
-        return None
+        else:
+            logger.debug(f"[{issue.key}] No status changes found")
+        return latest_update_time
 
     def _process_field_value(self, field: Any) -> Any:
         """Process field value based on its type."""
@@ -724,45 +761,40 @@ class JiraAirtableSync:
             # For object format, get the key directly
             return issue.key
     
-    def _create_new_records(self, records_to_create: List[Dict]):
+    def _upsert_records(self, records: List[Dict[str, Any]],
+                        existing_record_ids: Dict[str, str]) -> None:
         """
-        Create new records in Airtable.
-        
+        Create or update records in Airtable, keyed on the Jira key field.
+
         Args:
-            records_to_create: List of records to create
+            records: List of records to upsert, each a dict with a 'fields' key
+            existing_record_ids: Dictionary mapping Jira keys to Airtable record IDs;
+                updated in place with the IDs of the upserted records
         """
-        if not records_to_create:
+        if not records:
             return
-            
-        logger.info(f"Creating {len(records_to_create)} new records")
-        try:
-            created, failed = self._batch_create_with_progress(records_to_create)
-            logger.info(f"Created {created} new records")
-            if failed:
-                logger.warning(f"Failed to create {len(failed)} records: {failed}")
-        except Exception as e:
-            logger.error(f"Error creating records: {str(e)}")
-            raise
-    
-    def _update_existing_records(self, records_to_update: List[Dict]):
-        """
-        Update existing records in Airtable.
-        
-        Args:
-            records_to_update: List of records to update
-        """
-        if not records_to_update:
+
+        key_field_id = self._get_airtable_field_id('key')
+        if not key_field_id:
+            logger.error("No 'key' field mapping found in field_mappings")
             return
             
-        logger.info(f"Updating {len(records_to_update)} existing records")
+        logger.info(f"Upserting {len(records)} records")
         try:
-            # The records_to_update is now in the format expected by batch_update
-            self.table.batch_update(records_to_update)
-            logger.info(f"Updated {len(records_to_update)} records")
+            upserted, failed = self._batch_upsert_with_progress(records, key_field_id)
+            logger.info(f"Upserted {len(upserted)} records")
+            if failed:
+                logger.warning(f"Failed to upsert {len(failed)} records: {failed}")
         except Exception as e:
-            logger.error(f"Error updating records: {str(e)}")
+            logger.error(f"Error upserting records: {str(e)}")
             raise
 
+        # Record the IDs of newly created records so parent links can find them
+        for record in upserted:
+            jira_key = record['fields'].get(key_field_id)
+            if jira_key:
+                existing_record_ids[jira_key] = record['id']
+
     def _process_issue_batch(self, issues: List[Any], existing_record_ids: Dict[str, str]) -> None:
         """
         Process a batch of Jira issues and sync them to Airtable.
@@ -771,31 +803,18 @@ class JiraAirtableSync:
             issues: List of Jira issues to process
             existing_record_ids: Dictionary mapping Jira keys to Airtable record IDs
         """
-        records_to_create = []
-        records_to_update = []
-        keys_to_process = set()
+        records_to_upsert = []
 
         for issue in issues:
             issue_key = self._get_issue_key(issue)
             if not issue_key:
                 continue
                 
-            keys_to_process.add(issue_key)
             record_data = self._convert_issue_to_record(issue)
-
-            # Check if this issue already exists in Airtable
-            if issue_key in existing_record_ids and existing_record_ids[issue_key]:
-                # Update existing record
-                record_id = existing_record_ids[issue_key]
-                records_to_update.append({"id": record_id, "fields": record_data})
-                logger.debug(f"Updating existing record for {issue_key} (Airtable ID: {record_id})")
-            else:
-                # Create new record
-                records_to_create.append(record_data)
-                logger.debug(f"Creating new record for {issue_key}")
+            records_to_upsert.append({"fields": record_data})
+            logger.debug(f"Upserting record for {issue_key}")
         
-        self._create_new_records(records_to_create)
-        self._update_existing_records(records_to_update)
+        self._upsert_records(records_to_upsert, existing_record_ids)
 
         # Update parent relationships after all records are created/updated
         self._update_parent_relationships(issues, existing_record_ids)
@@ -907,25 +926,16 @@ class JiraAirtableSync:
         try:
             logger.info("Starting Jira to Airtable sync")
 
-            # Step 1: Fetch updated Jira issues
-            issues = self._fetch_updated_jira_issues()
-
-            if not issues:
-                logger.info("No issues found to sync")
-                return
-
-            # Step 2: Transform issues and prepare for sync
+            # Steps 1 and 2: Fetch updated Jira issues page by page and transform
+            # each one as it arrives, so the raw issues needn't all be kept
             transformed_issues = []
             key_to_parent = {}  # Store parent relationships for second pass
-            all_keys = set()  # Track all keys for existing record lookup
+            parent_keys = set()  # Parent keys whose Airtable record IDs must be looked up
             transform_errors = []  # Track issues that failed to transform
 
-            total_issues = len(issues)
-            logger.info(f"Processing {total_issues} issues")
-
-            for i, issue in enumerate(issues, 1):
+            for i, issue in enumerate(self._iter_updated_jira_issues(), 1):
                 if i % 100 == 0:  # Log progress every 100 issues
-                    logger.info(f"Transforming issues: {i}/{total_issues}")
+                    logger.info(f"Transforming issues: {i}")
 
                 try:
                     data = self._convert_issue_to_record(issue)
@@ -934,14 +944,17 @@ class JiraAirtableSync:
                     # Store parent relationship for second pass
                     if parent_key:
                         key_to_parent[issue.key] = parent_key
-                        all_keys.add(parent_key)  # Add parent key to lookup set
+                        parent_keys.add(parent_key)  # Add parent key to lookup set
 
                     transformed_issues.append((issue.key, data))
-                    all_keys.add(issue.key)
                 except Exception as e:
                     transform_errors.append(issue.key)
                     logger.error(f"[{issue.key}] Error transforming issue: {str(e)}", exc_info=True)
 
+            if not transformed_issues and not transform_errors:
+                logger.info("No issues found to sync")
+                return
+
             logger.info(f"Successfully transformed {len(transformed_issues)} issues")
             if transform_errors:
                 logger.error(
@@ -950,10 +963,9 @@ class JiraAirtableSync:
             if key_to_parent:
                 logger.info(f"Found {len(key_to_parent)} issues with parent relationships")
 
-            # Step 3: First pass - get existing record IDs
-            key_to_record_id = self._get_existing_record_ids(list(all_keys))
-            existing_count = len(key_to_record_id)
-            logger.info(f"Found {existing_count} existing records in Airtable")
+            # Step 3: Look up the record IDs of parent issues. The upserts report the
+            # IDs of the synced issues themselves, so those keys needn't be queried
+            key_to_record_id = self._get_existing_record_ids(list(parent_keys))
 
             # Step 4: Process all records without parent links first
             for i in range(0, len(transformed_issues), self.config.batch_size):
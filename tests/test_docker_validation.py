@@ -0,0 +1,30 @@
+from scripts.validation.docker import check_dockerfile
+
+
+def _check(tmp_path, monkeypatch, content):
+    (tmp_path / 'Dockerfile').write_text(content)
+    monkeypatch.chdir(tmp_path)
+    return check_dockerfile()
+
+
+def test_finds_required_stages(tmp_path, monkeypatch):
+    passed, _ = _check(tmp_path, monkeypatch, (
+        "FROM python:3.9-slim AS base\n"
+        "RUN pip install -r requirements.txt\n"
+        "from public.ecr.aws/lambda/python:3.9 as lambda\n"
+    ))
+    assert passed
+
+
+def test_accepts_flags_before_image(tmp_path, monkeypatch):
+    passed, _ = _check(tmp_path, monkeypatch, (
+        "FROM --platform=linux/amd64 python:3.9-slim AS base\n"
+        "FROM --platform=$BUILDPLATFORM public.ecr.aws/lambda/python:3.9 AS lambda\n"
+    ))
+    assert passed
+
+
+def test_reports_missing_stage(tmp_path, monkeypatch):
+    passed, message = _check(tmp_path, monkeypatch, "FROM python:3.9-slim AS base\n")
+    assert not passed
+    assert 'lambda' in message